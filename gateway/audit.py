@@ -0,0 +1,113 @@
+"""
+Audit batching: Keep audit-log I/O off the request path.
+
+Records are buffered in memory and written by a background flusher,
+either every `flush_interval` seconds or as soon as `max_batch` records
+are pending - whichever comes first.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from .logging import StructuredLogger, AuditRecord
+
+logger = logging.getLogger("gateway.audit")
+
+
+class AuditBatcher:
+    """
+    Buffers AuditRecords and flushes them to a StructuredLogger in batches.
+
+    The flusher task is started lazily on the running event loop. Call
+    `aclose()` (or `flush()`) before shutdown so pending records are written.
+    """
+
+    def __init__(
+        self,
+        logger: StructuredLogger,
+        max_batch: int = 100,
+        flush_interval: float = 1.0,
+        maxsize: int = 10000,
+    ):
+        self.logger = logger
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.maxsize = maxsize
+        self._pending: list[AuditRecord] = []
+        self._closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def put_nowait(self, record: AuditRecord) -> None:
+        """Enqueue a record without blocking the caller."""
+        if len(self._pending) >= self.maxsize:
+            # Buffer is full: write synchronously rather than drop the record
+            self.flush()
+        self._pending.append(record)
+
+        try:
+            self._ensure_flusher()
+        except RuntimeError:
+            # No running loop (sync caller) - nothing will flush later, so write now
+            self.flush()
+            return
+
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """
+        Write all pending records immediately.
+
+        A batch is only removed from the buffer once it has been written,
+        so a failing sink leaves the records pending for the next flush.
+        """
+        while self._pending:
+            batch = self._pending[: self.max_batch]
+            self.logger.log_audit_batch(batch)
+            del self._pending[: len(batch)]
+
+    async def aclose(self) -> None:
+        """Stop the background flusher and write any pending records."""
+        self._closed = True
+        task = self._task
+        self._task = None
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            self._wakeup.set()
+            await task
+        self.flush()
+        self._closed = False
+
+    async def __aenter__(self) -> "AuditBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _ensure_flusher(self) -> None:
+        """Start (or restart, after an event-loop change) the flusher task."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush on interval or when woken by a full batch, until closed."""
+        while not self._closed:
+            try:
+                async with asyncio.timeout(self.flush_interval):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._closed:
+                # aclose() performs the final flush
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Audit flush failed; records kept for retry")
@@ -32,15 +32,21 @@ class AuditRecord(BaseModel):
 class StructuredLogger:
     """JSONL structured logger for gateway operations."""
 
+    __slots__ = ("component",)
+
     def __init__(self, component: str):
         self.component = component
 
-    def _emit(self, record: dict[str, Any]) -> None:
-        """Write a log record as JSONL to stdout."""
+    def _format(self, record: dict[str, Any]) -> str:
+        """Serialize a log record as a single JSONL line."""
         if "timestamp" not in record:
             record["timestamp"] = datetime.now(timezone.utc).isoformat()
         record["component"] = self.component
-        print(json.dumps(record, default=str), file=sys.stdout, flush=True)
+        return json.dumps(record, default=str)
+
+    def _emit(self, record: dict[str, Any]) -> None:
+        """Write a log record as JSONL to stdout."""
+        print(self._format(record), file=sys.stdout, flush=True)
 
     def log_request(self, request_id: str, endpoint: str, payload: dict) -> None:
         """Log an incoming request."""
@@ -62,6 +68,31 @@ class StructuredLogger:
         """Log an error."""
         self._emit({"event": "error", "request_id": request_id, "error": error})
 
+    def _format_audit(self, record: AuditRecord) -> str:
+        """
+        Serialize an audit record as a single JSONL line.
+
+        The record body is encoded by pydantic's Rust core (model_dump_json)
+        instead of model_dump() + json.dumps. The line is stamped with the
+        event time, not the (later) write time.
+        """
+        return (
+            '{"event": "audit", "audit_record": '
+            + record.model_dump_json()
+            + ', "timestamp": '
+            + json.dumps(record.timestamp.isoformat())
+            + ', "component": '
+            + json.dumps(self.component)
+            + "}"
+        )
+
     def log_audit(self, record: AuditRecord) -> None:
         """Log a formal audit record."""
-        self._emit({"event": "audit", "audit_record": record.model_dump()})
+        print(self._format_audit(record), file=sys.stdout, flush=True)
+
+    def log_audit_batch(self, records: List[AuditRecord]) -> None:
+        """Log several audit records with a single write."""
+        if not records:
+            return
+        lines = [self._format_audit(r) for r in records]
+        print("\n".join(lines), file=sys.stdout, flush=True)
@@ -261,6 +261,7 @@ async def get_policy(policy_id: str):
 
 # Global runtime state
 orchestrator = Orchestrator()
+app.router.add_event_handler("shutdown", orchestrator.audit_batcher.aclose)
 sessions: dict[str, Session] = {}
 active_workflows: dict[str, Workflow] = {}
 
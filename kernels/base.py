@@ -20,6 +20,9 @@ class KernelInterface(ABC):
     - Accept validated KernelInput (not raw dicts)
     - Produce typed KernelOutput with provenance
     - Are stateless (same input → same output)
+
+    The orchestrator reuses one instance per kernel_id, so implementations
+    must not keep per-request state on `self`.
     """
 
     kernel_id: str
@@ -4,6 +4,7 @@ Constants Kernel: Authoritative physical constants table.
 Uses KernelInput/KernelOutput models.
 """
 
+import functools
 from typing import Optional
 from datetime import datetime
 
@@ -121,6 +122,19 @@ PHYSICAL_CONSTANTS = {
 }
 
 
+# Lowercased id + aliases per constant, built once for search
+_SEARCH_INDEX = [
+    (cid, (cid.lower(), *(alias.lower() for alias in cdata.get("aliases", []))))
+    for cid, cdata in PHYSICAL_CONSTANTS.items()
+]
+
+
+@functools.lru_cache(maxsize=256)
+def _search_ids(search_term: str) -> tuple[str, ...]:
+    """Ids of constants whose id or an alias contains the (lowercased) search term."""
+    return tuple(cid for cid, keys in _SEARCH_INDEX if any(search_term in key for key in keys))
+
+
 @register_kernel
 class ConstantsKernel(KernelInterface):
     """
@@ -163,11 +177,9 @@ class ConstantsKernel(KernelInterface):
                 )
 
         elif search_term:
-            matches = []
-            for cid, cdata in PHYSICAL_CONSTANTS.items():
-                aliases = cdata.get("aliases", [])
-                if search_term in cid.lower() or any(search_term in a.lower() for a in aliases):
-                    matches.append({"constant_id": cid, **cdata})
+            matches = [
+                {"constant_id": cid, **PHYSICAL_CONSTANTS[cid]} for cid in _search_ids(search_term)
+            ]
 
             if len(matches) == 1:
                 return self._make_output(request_id=request_id, success=True, result=matches[0])
@@ -5,6 +5,15 @@ from kernels.base import KernelInterface, register_kernel
 from models.kernel_io import KernelInput, KernelOutput
 
 
+def _sorted_median(ordered: List[float]) -> float:
+    """Median of already-sorted data, matching statistics.median."""
+    n = len(ordered)
+    mid = n // 2
+    if n % 2 == 1:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
 @register_kernel
 class StatisticsKernel(KernelInterface):
     """
@@ -109,12 +118,14 @@ class StatisticsKernel(KernelInterface):
         for name, values in series.items():
             if not values:
                 continue
+            # One sort serves median, min and max (statistics.median sorts anyway)
+            ordered = sorted(values)
             results[name] = {
                 "mean": statistics.mean(values),
-                "median": statistics.median(values),
+                "median": _sorted_median(ordered),
                 "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
-                "min": min(values),
-                "max": max(values),
+                "min": ordered[0],
+                "max": ordered[-1],
                 "n": len(values),
             }
 
@@ -100,6 +100,15 @@ class UnitsKernel(KernelInterface):
         """Legacy interface for backward compatibility."""
         return self._convert(args, "legacy")
 
+    def execute_batch(self, requests: list[dict]) -> list[KernelOutput]:
+        """
+        Convert several legacy-style arg dicts in one call.
+
+        Results are returned in input order; unknown units yield a failed
+        KernelOutput for that entry rather than raising.
+        """
+        return [self._convert(args, f"batch_{i}") for i, args in enumerate(requests)]
+
     def _convert(self, args: dict, request_id: str) -> KernelOutput:
         """Core conversion logic."""
         value = args.get("value")
@@ -14,6 +14,16 @@ INDEX_ROOT = "indexes"
 MANIFEST_PATH = "ingest/manifest.jsonl"
 
 
+def compute_content_hash(content: str) -> str:
+    """
+    Fingerprint document content for exact dedup and partitioning.
+
+    BLAKE2b with a 16-byte digest keeps the 32-hex-char format of the
+    previous MD5 hashes while being faster and collision-resistant.
+    """
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
 class RawImportStage(PipelineStage[dict, Document]):
     """
     Stage 1: Validates raw input and creates a canonical Document object.
@@ -29,7 +39,7 @@ class RawImportStage(PipelineStage[dict, Document]):
         if not content:
             raise ValueError("Content is required")
 
-        doc_hash = hashlib.md5(content.encode()).hexdigest()
+        doc_hash = compute_content_hash(content)
 
         provenance = Provenance(
             source_name=source_name,
@@ -104,13 +114,14 @@ class PartitioningStage(PipelineStage[Document, Document]):
         first_byte = int(doc.content_hash[:2], 16)
 
         if first_byte < 128:  # 00-7F
-            doc.partition = Partition.TRAIN
+            partition = Partition.TRAIN
         elif first_byte < 192:  # 80-BF
-            doc.partition = Partition.DEV
+            partition = Partition.DEV
         else:  # C0-FF
-            doc.partition = Partition.TEST
+            partition = Partition.TEST
 
-        return doc
+        # Documents are frozen; return an updated copy
+        return doc.model_copy(update={"partition": partition})
 
 
 class PersistenceStage(PipelineStage[Document, Document]):
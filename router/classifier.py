@@ -5,10 +5,12 @@ Rule-based routing with LLM as tie-breaker only.
 Output is a typed TaskSpec, not freeform dict.
 """
 
+import functools
 import re
 from typing import Optional
 
-from models.task_spec import TaskSpec, TaskRequest, Domain, RiskLevel
+from models.task_spec import TaskSpec, TaskRequest, Domain, Partition, RiskLevel
+from validator.term_scanner import TermScanner
 
 
 # --- Feature Extraction (Deterministic) ---
@@ -271,32 +273,63 @@ AMBIGUOUS_TERMS = [
 ]
 
 
+# Compiled once at import; the raw pattern lists above stay the source of truth
+_UNIT_RES = [re.compile(pattern, re.IGNORECASE) for pattern in UNIT_PATTERNS]
+_EQUATION_RE = re.compile("|".join(f"(?:{pattern})" for pattern in EQUATION_PATTERNS))
+_NUMBER_RE = re.compile(r"\b\d+\.?\d*\b")
+
+_KEYWORD_DOMAINS: dict[str, list[str]] = {}
+for _domain, _keywords in DOMAIN_KEYWORDS.items():
+    for _kw in _keywords:
+        _KEYWORD_DOMAINS.setdefault(_kw, []).append(_domain)
+_KEYWORD_SCANNER = TermScanner(tuple(AMBIGUOUS_TERMS) + tuple(_KEYWORD_DOMAINS))
+
+
 def extract_features(text: str) -> dict:
-    """Extract deterministic features from input text."""
+    """
+    Extract deterministic features from input text.
+
+    Results are memoized per text (see _features_for); the returned dict is
+    a fresh copy, so callers may mutate it.
+    """
+    features = _features_for(text)
+    return {
+        **features,
+        "units_found": list(features["units_found"]),
+        "ambiguous_terms": list(features["ambiguous_terms"]),
+        "domain_scores": dict(features["domain_scores"]),
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _features_for(text: str) -> dict:
+    """Uncopied, cached feature extraction. Use _features_for.cache_info() for hit rates."""
     text_lower = text.lower()
 
     # Check for units
     units_found = []
-    for pattern in UNIT_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        units_found.extend(matches)
+    for pattern in _UNIT_RES:
+        units_found.extend(pattern.findall(text))
 
     # Check for equations
-    has_equations = any(re.search(pattern, text) for pattern in EQUATION_PATTERNS)
+    has_equations = _EQUATION_RE.search(text) is not None
 
     # Count numeric values
-    numbers = re.findall(r"\b\d+\.?\d*\b", text)
+    numbers = _NUMBER_RE.findall(text)
     numeric_density = len(numbers) / max(len(text.split()), 1)
 
+    # One scan finds every ambiguous term and domain keyword
+    hits = _KEYWORD_SCANNER.find(text_lower)
+
     # Check for ambiguous terms
-    ambiguous_found = [term for term in AMBIGUOUS_TERMS if term in text_lower]
+    ambiguous_found = [term for term in AMBIGUOUS_TERMS if term in hits]
 
-    # Domain keyword matches
+    # Domain keyword matches (duplicate keywords in a list count each time)
     domain_scores = {}
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in text_lower)
-        if score > 0:
-            domain_scores[domain] = score
+    for kw in hits:
+        for domain in _KEYWORD_DOMAINS.get(kw, ()):
+            domain_scores[domain] = domain_scores.get(domain, 0) + 1
+    domain_scores = {d: domain_scores[d] for d in DOMAIN_KEYWORDS if d in domain_scores}
 
     return {
         "units_found": units_found,
@@ -314,11 +347,23 @@ def classify_task(request: TaskRequest) -> TaskSpec:
     This is deterministic - same input produces same output.
     Returns a validated, immutable TaskSpec.
     """
-    features = extract_features(request.user_input)
+    spec = _classify_cached(request.user_input, request.domain_hint, request.partition)
+    return spec.model_copy(update={"request_id": request.request_id})
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_cached(user_input: str, domain_hint: Optional[str], partition: Partition) -> TaskSpec:
+    """
+    Classification for everything except request_id, memoized per input.
+
+    The cached TaskSpec is shared (shallow-copied) by every caller; it is
+    frozen, and its lists must be treated as read-only.
+    """
+    features = _features_for(user_input)
 
     # Determine domain
-    if request.domain_hint:
-        domain_str = request.domain_hint
+    if domain_hint:
+        domain_str = domain_hint
     elif features["domain_scores"]:
         # Pick highest scoring domain
         domain_str = max(features["domain_scores"], key=features["domain_scores"].get)
@@ -386,17 +431,17 @@ def classify_task(request: TaskRequest) -> TaskSpec:
 
     # Build validated TaskSpec (immutable)
     return TaskSpec(
-        request_id=request.request_id,
+        request_id="",
         domain=domain,
         subdomain=subdomain,
-        partition=request.partition,
+        partition=partition,
         needs_units=bool(features["units_found"]),
         has_equations=features["has_equations"],
         risk_level=risk_level,
         required_gates=required_gates,
         selected_kernels=selected_kernels,
-        user_input=request.user_input,
-        confidence=1.0 if request.domain_hint else 0.8,
+        user_input=user_input,
+        confidence=1.0 if domain_hint else 0.8,
     )
 
 
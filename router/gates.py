@@ -9,10 +9,23 @@ Gates evaluate task specs and decide:
 Provides lab-specific gates for AI Lab workflows.
 """
 
+import re
 from typing import Optional
 from enum import Enum
 from dataclasses import dataclass
 
+from validator.term_scanner import term_scanner
+
+
+def _keyword_re(keywords) -> re.Pattern:
+    """
+    Compile keywords into a single alternation, scanned in one pass.
+
+    Keywords keep substring semantics (no word boundaries), matching the
+    previous `any(kw in text for kw in keywords)` checks.
+    """
+    return re.compile("|".join(map(re.escape, keywords)))
+
 
 class GateDecision(str, Enum):
     """Possible gate outcomes."""
@@ -22,7 +35,35 @@ class GateDecision(str, Enum):
     BLOCK = "block"  # Reject the task
 
 
-@dataclass
+def _task_text(task_spec: dict) -> str:
+    """Text a gate inspects: the raw input, falling back to the intent."""
+    if isinstance(task_spec, str):
+        return task_spec
+    return task_spec.get("raw_input", "") or task_spec.get("intent", "")
+
+
+@dataclass(frozen=True, slots=True)
+class TokenView:
+    """
+    Pre-processed task text, computed once and shared by every gate.
+
+    GatePipeline builds one view per evaluation and passes it to the gates
+    under the "_tv" context key, so the input is lowercased and scanned for
+    ambiguous terms once instead of once per gate.
+    """
+
+    raw: str
+    lower: str
+    ambiguous_hits: frozenset[str]
+
+    @classmethod
+    def build(cls, raw: str) -> "TokenView":
+        lower = raw.lower()
+        hits = term_scanner(tuple(LabAmbiguityGate.AMBIGUOUS_TERMS)).find(lower)
+        return cls(raw=raw, lower=lower, ambiguous_hits=frozenset(hits))
+
+
+@dataclass(slots=True)
 class GateResult:
     """Result from gate evaluation."""
 
@@ -46,6 +87,16 @@ class Gate:
             gate_id=self.gate_id,
         )
 
+    def _get_text(self, task_spec: dict) -> str:
+        """Extract text content from task spec."""
+        return _task_text(task_spec)
+
+    def _text_view(self, task_spec: dict) -> TokenView:
+        """Return the pipeline's shared TokenView, building one if absent."""
+        if isinstance(task_spec, dict) and "_tv" in task_spec:
+            return task_spec["_tv"]
+        return TokenView.build(self._get_text(task_spec))
+
 
 # =============================================================================
 # Lab Ambiguity Gate
@@ -134,13 +185,14 @@ class LabAmbiguityGate(Gate):
 
     def evaluate(self, task_spec: dict) -> GateResult:
         """Check for ambiguous lab terminology."""
-        text = self._get_text(task_spec).lower()
+        view = self._text_view(task_spec)
+        text = view.lower
 
         ambiguities = []
         questions = []
 
         for term, info in self.AMBIGUOUS_TERMS.items():
-            if term in text and not self._is_disambiguated(term, text):
+            if term in view.ambiguous_hits and not self._is_disambiguated(term, text):
                 ambiguities.append(term)
                 questions.append(info["clarify"])
 
@@ -159,22 +211,18 @@ class LabAmbiguityGate(Gate):
             reason="No ambiguous lab terminology detected",
         )
 
-    def _get_text(self, task_spec: dict) -> str:
-        """Extract text content from task spec."""
-        if isinstance(task_spec, str):
-            return task_spec
-        return task_spec.get("raw_input", "") or task_spec.get("intent", "")
-
     def _is_disambiguated(self, term: str, text: str) -> bool:
         """Check if term is already disambiguated by context."""
         if term not in self.DISAMBIGUATORS:
             return False
 
-        for meaning, keywords in self.DISAMBIGUATORS[term].items():
-            if any(kw in text for kw in keywords):
-                return True
+        return _DISAMBIGUATOR_RES[term].search(text) is not None
 
-        return False
+
+_DISAMBIGUATOR_RES = {
+    term: _keyword_re(kw for keywords in meanings.values() for kw in keywords)
+    for term, meanings in LabAmbiguityGate.DISAMBIGUATORS.items()
+}
 
 
 # =============================================================================
@@ -232,7 +280,7 @@ class ExperimentSafetyGate(Gate):
 
     def evaluate(self, task_spec: dict) -> GateResult:
         """Evaluate experiment safety requirements."""
-        text = self._get_text(task_spec).lower()
+        text = self._text_view(task_spec).lower
         domain = task_spec.get("domain", "")
 
         # Only apply to experiment domain
@@ -247,9 +295,9 @@ class ExperimentSafetyGate(Gate):
         questions = []
 
         # Check for human subjects
-        has_human_subjects = any(kw in text for kw in self.HUMAN_SUBJECTS_KEYWORDS)
-        has_ethics = any(kw in text for kw in self.ETHICS_KEYWORDS)
-        has_risk = any(kw in text for kw in self.RISK_INDICATORS)
+        has_human_subjects = _HUMAN_SUBJECTS_RE.search(text) is not None
+        has_ethics = _ETHICS_RE.search(text) is not None
+        has_risk = _RISK_RE.search(text) is not None
 
         if has_human_subjects and not has_ethics:
             issues.append("human_subjects_no_ethics")
@@ -263,9 +311,7 @@ class ExperimentSafetyGate(Gate):
 
         # Check for control group in experiments
         if domain == "experiment":
-            has_control = any(
-                kw in text for kw in ["control group", "control condition", "placebo", "baseline"]
-            )
+            has_control = _CONTROL_RE.search(text) is not None
             if not has_control:
                 issues.append("no_control_group")
                 questions.append("No control group mentioned. Is this a controlled experiment?")
@@ -295,11 +341,11 @@ class ExperimentSafetyGate(Gate):
             reason="Experiment safety requirements met",
         )
 
-    def _get_text(self, task_spec: dict) -> str:
-        """Extract text content from task spec."""
-        if isinstance(task_spec, str):
-            return task_spec
-        return task_spec.get("raw_input", "") or task_spec.get("intent", "")
+
+_HUMAN_SUBJECTS_RE = _keyword_re(ExperimentSafetyGate.HUMAN_SUBJECTS_KEYWORDS)
+_ETHICS_RE = _keyword_re(ExperimentSafetyGate.ETHICS_KEYWORDS)
+_RISK_RE = _keyword_re(ExperimentSafetyGate.RISK_INDICATORS)
+_CONTROL_RE = _keyword_re(("control group", "control condition", "placebo", "baseline"))
 
 
 # =============================================================================
@@ -333,7 +379,7 @@ class DataQualityGate(Gate):
 
     def evaluate(self, task_spec: dict) -> GateResult:
         """Check data quality specifications."""
-        text = self._get_text(task_spec).lower()
+        text = self._text_view(task_spec).lower
         domain = task_spec.get("domain", "")
 
         # Only apply to analysis domain
@@ -344,7 +390,7 @@ class DataQualityGate(Gate):
                 reason="Not a data domain task",
             )
 
-        has_data_mention = any(kw in text for kw in self.DATA_KEYWORDS)
+        has_data_mention = _DATA_RE.search(text) is not None
         if not has_data_mention:
             return GateResult(
                 decision=GateDecision.PASS,
@@ -355,14 +401,12 @@ class DataQualityGate(Gate):
         questions = []
 
         # Check for data source specification
-        has_source = any(
-            kw in text for kw in ["from", "source", "file", "path", "query", "fetch", "load"]
-        )
+        has_source = _SOURCE_RE.search(text) is not None
         if not has_source:
             questions.append("Where is the data coming from?")
 
         # Check for format specification
-        has_format = any(kw in text for kw in ["csv", "json", "excel", "parquet", "sql", "format"])
+        has_format = _FORMAT_RE.search(text) is not None
         if not has_format:
             questions.append("What format is the data in?")
 
@@ -380,10 +424,10 @@ class DataQualityGate(Gate):
             reason="Data specifications adequate",
         )
 
-    def _get_text(self, task_spec: dict) -> str:
-        if isinstance(task_spec, str):
-            return task_spec
-        return task_spec.get("raw_input", "") or task_spec.get("intent", "")
+
+_DATA_RE = _keyword_re(DataQualityGate.DATA_KEYWORDS)
+_SOURCE_RE = _keyword_re(("from", "source", "file", "path", "query", "fetch", "load"))
+_FORMAT_RE = _keyword_re(("csv", "json", "excel", "parquet", "sql", "format"))
 
 
 # =============================================================================
@@ -422,8 +466,15 @@ class GatePipeline:
     def __init__(self, gates: Optional[list[Gate]] = None):
         self.gates = gates or get_all_gates()
 
+    def _with_view(self, task_spec: dict) -> dict:
+        """Attach a shared TokenView so each gate skips its own text prep."""
+        if not isinstance(task_spec, dict) or "_tv" in task_spec:
+            return task_spec
+        return {**task_spec, "_tv": TokenView.build(_task_text(task_spec))}
+
     def evaluate(self, task_spec: dict) -> GateResult:
         """Run all gates and return first non-PASS result."""
+        task_spec = self._with_view(task_spec)
         for gate in self.gates:
             result = gate.evaluate(task_spec)
             if result.decision != GateDecision.PASS:
@@ -437,4 +488,5 @@ class GatePipeline:
 
     def evaluate_all(self, task_spec: dict) -> list[GateResult]:
         """Run all gates and return all results."""
+        task_spec = self._with_view(task_spec)
         return [gate.evaluate(task_spec) for gate in self.gates]
@@ -8,6 +8,8 @@ Provides two execution modes:
 Determinism: D2 (frozen parameters, validated outputs)
 """
 
+import functools
+import importlib.util
 import os
 import json
 import hashlib
@@ -15,13 +17,13 @@ from typing import Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
-# OpenRouter integration (optional, for complex tasks)
-try:
-    import httpx
 
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+# OpenRouter integration (optional, for complex tasks). httpx is only
+# imported when an OpenRouter call is actually made.
+@functools.lru_cache(maxsize=1)
+def httpx_available() -> bool:
+    """Whether httpx is installed (checked without importing it)."""
+    return importlib.util.find_spec("httpx") is not None
 
 
 class ExtractionMode(str, Enum):
@@ -169,7 +171,7 @@ class LLMSpecExtractor:
     def _openrouter_available(self) -> bool:
         """Check if OpenRouter is configured and available."""
         return (
-            HTTPX_AVAILABLE
+            httpx_available()
             and self.config.openrouter_api_key is not None
             and len(self.config.openrouter_api_key) > 0
         )
@@ -306,6 +308,8 @@ class LLMSpecExtractor:
 
     def _call_openrouter(self, user_input: str) -> str:
         """Make API call to OpenRouter."""
+        import httpx
+
         url = "https://openrouter.ai/api/v1/chat/completions"
 
         headers = {
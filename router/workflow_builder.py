@@ -13,6 +13,11 @@ from models.workflow import Workflow, WorkflowStep, WorkflowStatus
 from router.llm_extractor import extract_spec, ExtractionConfig, ExtractionMode
 from router.classifier import classify_task
 
+# "N. " item markers of a numbered list
+_NUMBERED_STEP_RE = re.compile(r"\s*\d+\.\s+")
+# ", then " / "; next " / ". Finally " style transitions
+_SEQUENCE_SPLIT_RE = re.compile(r"[,;.]\s+(?:then|next|after that|finally)\s+", re.IGNORECASE)
+
 
 class WorkflowBuilder:
     """Builds workflows from task requests."""
@@ -104,7 +109,7 @@ class WorkflowBuilder:
 
         # 1. Check for numbered list pattern "1. ... 2. ..."
         # Split by "N. "
-        numbered_steps = re.split(r"\s*\d+\.\s+", text)
+        numbered_steps = _NUMBERED_STEP_RE.split(text)
         # Filter out empty strings (often the first if text starts with "1.")
         numbered_steps = [s.strip() for s in numbered_steps if s.strip()]
 
@@ -114,8 +119,7 @@ class WorkflowBuilder:
         # 2. Check for "then", "next", "after that"
         # Be careful not to split inside sentences needlessly
         # Matches ", then " or "; then " or ". Then "
-        split_pattern = r"[,;.]\s+(?:then|next|after that|finally)\s+"
-        sequence_steps = re.split(split_pattern, text, flags=re.IGNORECASE)
+        sequence_steps = _SEQUENCE_SPLIT_RE.split(text)
 
         if len(sequence_steps) > 1:
             return [s.strip() for s in sequence_steps]
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 import uuid
 import traceback
@@ -8,9 +10,11 @@ from models.task_spec import TaskSpec
 from models.kernel_io import KernelInput, KernelOutput
 from models.session import Session
 from kernels import get_kernel
+from kernels.base import KernelInterface
 from router.classifier import classify_task  # To deduce kernels if not set
 from validator.gates import run_gates, get_blocking_decisions
 from gateway.logging import StructuredLogger, AuditRecord
+from gateway.audit import AuditBatcher
 from gateway.compliance import ComplianceChecker
 from telemetry.tracer import get_tracer
 
@@ -27,6 +31,33 @@ class Orchestrator:
 
     def __init__(self):
         self.compliance = ComplianceChecker()
+        # Audit records are batched off the request path; call aclose() on shutdown
+        self.audit_batcher = AuditBatcher(logger_struct)
+        # Access decisions depend only on (user, resource, action); memoize them
+        self._kernel_instances: dict[str, KernelInterface] = {}
+        self._check_access = functools.lru_cache(maxsize=4096)(self._check_access_uncached)
+
+    def _check_access_uncached(self, user_id: str, resource: str, action: str) -> bool:
+        return self.compliance.check_access(user_id, resource, action)
+
+    def _get_kernel_instance(self, kernel_id: str) -> KernelInterface:
+        """
+        Return a shared kernel instance, creating it on first use.
+
+        Kernels are stateless by contract (see KernelInterface), so one
+        instance per kernel_id is reused across steps.
+        """
+        kernel = self._kernel_instances.get(kernel_id)
+        if kernel is None:
+            kernel_class = get_kernel(kernel_id)
+            if not kernel_class:
+                raise ValueError(f"Kernel {kernel_id} not found in registry")
+            kernel = self._kernel_instances[kernel_id] = kernel_class()
+        return kernel
+
+    def invalidate_access_cache(self) -> None:
+        """Drop memoized access decisions (call after a policy reload)."""
+        self._check_access.cache_clear()
 
     async def run_step(self, step: WorkflowStep, session: Session) -> WorkflowStep:
         """
@@ -41,7 +72,7 @@ class Orchestrator:
         try:
             # 0. Compliance Check (Phase 6)
             user_id = session.user_id if hasattr(session, "user_id") else "unknown"
-            if not self.compliance.check_access(user_id, step.step_id, "execute"):
+            if not self._check_access(user_id, step.step_id, "execute"):
                 # Log violation
                 audit = AuditRecord(
                     event_id=str(uuid.uuid4()),
@@ -52,7 +83,7 @@ class Orchestrator:
                     details={"reason": "Access Denied"},
                     policy_violations=["access_control"],
                 )
-                logger_struct.log_audit(audit)
+                self.audit_batcher.put_nowait(audit)
 
                 step.status = WorkflowStatus.BLOCKED
                 step.error = "Compliance violation: Access Denied"
@@ -83,7 +114,7 @@ class Orchestrator:
                     details={"reason": "Gate Failure", "gates": reasons},
                     gates_passed=[g.gate_id for g in gate_decisions if not g.is_blocking()],
                 )
-                logger_struct.log_audit(audit)
+                self.audit_batcher.put_nowait(audit)
 
                 step.status = WorkflowStatus.BLOCKED
                 step.error = f"Blocked by gates: {'; '.join(reasons)}"
@@ -106,10 +137,7 @@ class Orchestrator:
                 raise ValueError(f"No kernel selected for step {step.step_id}")
 
             kernel_id = spec.selected_kernels[0]  # Pick first for now
-            kernel_class = get_kernel(kernel_id)
-
-            if not kernel_class:
-                raise ValueError(f"Kernel {kernel_id} not found in registry")
+            kernel = self._get_kernel_instance(kernel_id)
 
             # 3. Prepare Input
             # Merge session context with spec args
@@ -125,9 +153,7 @@ class Orchestrator:
             # But we don't know expected args easily without envelope.
             # For now, just pass explicit args.
 
-            # 4. Instantiate and Execute Kernel
-            kernel = kernel_class()
-
+            # 4. Execute Kernel
             kernel_input = KernelInput(
                 kernel_id=kernel_id,
                 request_id=f"exec_{uuid.uuid4()}",
@@ -138,7 +164,9 @@ class Orchestrator:
             # Validate input? Kernel.execute checks args but `KernelInterface` has `validate_args`.
             # We trust kernel to validate inside execute (it takes KernelInput).
 
-            output: KernelOutput = kernel.execute(kernel_input)
+            # Kernels are synchronous; run them off the event loop so other
+            # coroutines (e.g. the audit flusher) keep making progress.
+            output: KernelOutput = await asyncio.to_thread(kernel.execute, kernel_input)
 
             # 5. Handle Output
             if output.success:
@@ -165,7 +193,7 @@ class Orchestrator:
                     details={"kernel": kernel_id, "workflow_id": session.active_workflow_id},
                     gates_passed=[g.gate_id for g in gate_decisions] if gate_decisions else [],
                 )
-                logger_struct.log_audit(audit)
+                self.audit_batcher.put_nowait(audit)
 
                 # If result is a dict, merge into context?
                 # Be careful not to pollute.
@@ -178,16 +206,47 @@ class Orchestrator:
                 session.add_history("step_failed", {"step_id": step.step_id, "error": output.error})
 
         except Exception as e:
-            logger.error(f"Step execution failed: {e}")
+            # logger.exception reuses the active exc_info; the stack is only
+            # formatted if a handler actually emits the record.
+            logger.exception(f"Step execution failed: {e}")
             step.status = WorkflowStatus.FAILED
-            step.output = {"error": str(e), "traceback": traceback.format_exc()}
+            step.output = {"error": str(e)}
+            if logger.isEnabledFor(logging.DEBUG):
+                step.output["traceback"] = traceback.format_exc()
 
         return step
 
+    async def __aenter__(self) -> "Orchestrator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.audit_batcher.aclose()
+
     async def run_workflow(self, workflow: Workflow, session: Session) -> Workflow:
         """
         Run workflow loop until blocked or finished.
+
+        Audit records buffered during the run are written before returning.
+        """
+        try:
+            return await self._run_workflow(workflow, session)
+        finally:
+            self.audit_batcher.flush()
+
+    async def run_many(self, runs: List[tuple[Workflow, Session]]) -> List[Workflow]:
+        """
+        Run independent workflows concurrently; results keep the input order.
+
+        Each workflow needs its own Session, since a session tracks a single
+        active workflow and merges step results into its context.
         """
+        return list(
+            await asyncio.gather(
+                *(self.run_workflow(workflow, session) for workflow, session in runs)
+            )
+        )
+
+    async def _run_workflow(self, workflow: Workflow, session: Session) -> Workflow:
         with tracer.start_as_current_span("orchestrator.run_workflow") as span:
             span.set_attribute("workflow_id", workflow.workflow_id)
         # Set session active workflow
@@ -218,10 +277,13 @@ class Orchestrator:
                         workflow.status = WorkflowStatus.BLOCKED
                 break
 
-            # 2. Execute ready steps (sequential for now)
+            # 2. Execute ready steps concurrently; they have no dependencies on
+            # each other, so a wave takes as long as its slowest step.
+            # run_step() records failures on the step instead of raising.
+            await asyncio.gather(*(self.run_step(step, session) for step in ready_steps))
+
             progress_made = False
             for step in ready_steps:
-                await self.run_step(step, session)
                 if step.status == WorkflowStatus.COMPLETED:
                     progress_made = True
                 elif step.status == WorkflowStatus.FAILED:
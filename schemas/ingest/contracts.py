@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Literal, Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class Partition(str, Enum):
@@ -21,11 +21,18 @@ class License(str, Enum):
     UNKNOWN = "Unknown"
 
 
+# Artifacts are immutable once built: stages return updated copies instead of
+# mutating in place, which also lets Pydantic skip assignment validation.
+FROZEN_CONFIG = ConfigDict(frozen=True)
+
+
 class Provenance(BaseModel):
     """
     Tracks the origin and lineage of a data artifact.
     """
 
+    model_config = FROZEN_CONFIG
+
     source_name: str = Field(..., description="Name of the data source (e.g., 'OpenStax_Physics')")
     source_uri: str = Field(..., description="URI or path to the original source")
     author: Optional[str] = Field(None, description="Original author or creator")
@@ -42,6 +49,8 @@ class BaseArtifact(BaseModel):
     Base class for all ingested artifacts.
     """
 
+    model_config = FROZEN_CONFIG
+
     id: str = Field(default_factory=lambda: str(uuid4()), description="Unique artifact ID")
     partition: Partition = Field(
         default=Partition.UNASSIGNED, description="Assigned data partition"
@@ -56,7 +65,7 @@ class Document(BaseArtifact):
     """
 
     content: str = Field(..., description="Full text content of the document")
-    content_hash: str = Field(..., description="MD5 hash of the content for exact dedup")
+    content_hash: str = Field(..., description="BLAKE2b-128 hash of the content for exact dedup")
 
     @field_validator("content")
     def content_not_empty(cls, v):
@@ -66,6 +75,8 @@ class Document(BaseArtifact):
 
 
 class Span(BaseModel):
+    model_config = FROZEN_CONFIG
+
     start: int
     end: int
 
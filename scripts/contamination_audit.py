@@ -1,39 +1,53 @@
 import os
 import hashlib
-import glob
 import re
 import json
-from typing import Set, Dict, List
+import random
+import sqlite3
+from typing import Container, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 # Constants for MinHash
 NUM_HASHES = 100
-HASH_SEEDS = [i * 1337 for i in range(NUM_HASHES)]
+MERSENNE_PRIME = (1 << 61) - 1
+SHINGLE_SIZE = 3
 
+# Each permutation is a universal hash h(x) = (a * x + b) mod p applied to a
+# single base hash per shingle, so shingles are hashed once, not NUM_HASHES times.
+_rng = random.Random(1337)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_HASHES)
+]
 
-def get_shingles(text: str, k: int = 3) -> Set[str]:
-    """Generate k-shingles (n-grams) from text."""
+# Identifies the signature scheme; cached signatures made under other
+# parameters are recomputed rather than compared against new ones.
+SIGNATURE_PARAMS = hashlib.blake2b(
+    json.dumps(["blake2b-64", SHINGLE_SIZE, MERSENNE_PRIME, PERMUTATIONS]).encode(),
+    digest_size=8,
+).hexdigest()
+
+
+def _hash64(shingle: str) -> int:
+    """64-bit base hash of a single shingle."""
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+
+
+def get_shingles(text: str, k: int = SHINGLE_SIZE) -> FrozenSet[int]:
+    """
+    Generate hashed k-shingles (n-grams) from text.
+
+    Only the 64-bit hashes are kept; the substring set is transient.
+    """
     text = re.sub(r"\s+", " ", text.strip().lower())
     if len(text) < k:
-        return {text}
-    return {text[i : i + k] for i in range(len(text) - k + 1)}
+        return frozenset((_hash64(text),))
+    return frozenset(map(_hash64, {text[i : i + k] for i in range(len(text) - k + 1)}))
 
 
 def compute_minhash(text: str) -> List[int]:
     """Compute MinHash signature for text."""
     shingles = get_shingles(text)
-    signature = []
-
-    for seed in HASH_SEEDS:
-        min_hash = float("inf")
-        for shingle in shingles:
-            # Simple combined hash
-            h = hashlib.md5(f"{seed}_{shingle}".encode()).hexdigest()
-            h_int = int(h, 16)
-            if h_int < min_hash:
-                min_hash = h_int
-        signature.append(min_hash)
-
-    return signature
+    return [min((a * h + b) % MERSENNE_PRIME for h in shingles) for a, b in PERMUTATIONS]
 
 
 def compute_jaccard_similarity(sig1: List[int], sig2: List[int]) -> float:
@@ -42,33 +56,168 @@ def compute_jaccard_similarity(sig1: List[int], sig2: List[int]) -> float:
     return matches / len(sig1)
 
 
+def iter_files(root: str, suffix: str = "") -> Iterator[str]:
+    """
+    Yield paths of files under root, optionally filtered by suffix.
+
+    Matches glob("**/*", recursive=True) + isfile: hidden entries are skipped,
+    symlinked files are followed, and unreadable directories are ignored.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith(suffix) and entry.is_file():
+                yield entry.path
+
+
+def content_digest(content: str) -> str:
+    """Exact-match fingerprint of document content."""
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def read_content(filepath: str) -> str:
+    """Read the "content" field of a JSON document ("" if missing or unreadable)."""
+    try:
+        with open(filepath, "r") as f:
+            # Ingested documents are JSON with a "content" field
+            return json.load(f).get("content", "") or ""
+    except Exception:
+        return ""
+
+
+def load_documents(directory: str) -> Dict[str, str]:
+    """
+    Loads the non-empty "content" field of every JSON document in a directory.
+    """
+    documents = {}
+    if not os.path.exists(directory):
+        return documents
+
+    # Assuming JSON content for documents
+    for filepath in iter_files(directory, ".json"):
+        content = read_content(filepath)
+        if content:
+            documents[filepath] = content
+    return documents
+
+
 def load_file_signatures(directory: str) -> Dict[str, List[int]]:
     """
     Computes MinHash signatures of all file contents in a directory.
     """
-    signatures = {}
+    return {path: compute_minhash(content) for path, content in load_documents(directory).items()}
+
+
+class PartitionManifest:
+    """
+    Persistent cache of per-file fingerprints for incremental audits.
+
+    Entries are keyed by path and reused while the file's (mtime, size) is
+    unchanged, so unchanged documents are neither re-read nor re-hashed.
+    Signatures are only reused if they were made under SIGNATURE_PARAMS.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = sqlite3.connect(db_path)
+        # Earlier layout, without the signature parameters
+        self._conn.execute("DROP TABLE IF EXISTS files")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "digest TEXT, signature TEXT, signature_params TEXT)"
+        )
+
+    def fingerprint(
+        self, filepath: str, skip_signature_for: Container[str] = ()
+    ) -> Optional[Tuple[str, Optional[List[int]]]]:
+        """
+        Return (content_digest, minhash_signature) for a document.
+
+        Returns None for documents without content. The signature is None,
+        and not computed, when the digest is in skip_signature_for (e.g. an
+        exact copy that needs no near-duplicate check).
+        """
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+
+        row = self._conn.execute(
+            "SELECT mtime_ns, size, digest, signature, signature_params "
+            "FROM fingerprints WHERE path = ?",
+            (filepath,),
+        ).fetchone()
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            digest = row[2]
+            if not digest:
+                return None
+            if digest in skip_signature_for:
+                return digest, None
+            if row[3] is not None and row[4] == SIGNATURE_PARAMS:
+                return digest, json.loads(row[3])
+
+        content = read_content(filepath)
+        if not content:
+            self._store(filepath, st, "", None)
+            return None
+        digest = content_digest(content)
+        signature = None if digest in skip_signature_for else compute_minhash(content)
+        self._store(filepath, st, digest, signature)
+        return digest, signature
+
+    def _store(
+        self, filepath: str, st: os.stat_result, digest: str, signature: Optional[List[int]]
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                filepath,
+                st.st_mtime_ns,
+                st.st_size,
+                digest,
+                json.dumps(signature) if signature is not None else None,
+                SIGNATURE_PARAMS if signature is not None else None,
+            ),
+        )
+
+    def prune_missing(self) -> None:
+        """Drop entries for files that no longer exist."""
+        paths = [row[0] for row in self._conn.execute("SELECT path FROM fingerprints")]
+        self._conn.executemany(
+            "DELETE FROM fingerprints WHERE path = ?",
+            [(path,) for path in paths if not os.path.exists(path)],
+        )
+
+    def close(self) -> None:
+        """Persist pending entries and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+
+def list_documents(directory: str) -> List[str]:
+    """List JSON document paths under a directory (empty if it doesn't exist)."""
     if not os.path.exists(directory):
-        return signatures
-
-    for filepath in glob.glob(os.path.join(directory, "**/*"), recursive=True):
-        if os.path.isfile(filepath) and filepath.endswith(
-            ".json"
-        ):  # Assuming JSON content for documents
-            try:
-                with open(filepath, "r") as f:
-                    # Ingested documents are JSON with a "content" field
-                    data = json.load(f)
-                    content = data.get("content", "")
-                    if content:
-                        signatures[filepath] = compute_minhash(content)
-            except Exception:
-                pass
-    return signatures
+        return []
+    return list(iter_files(directory, ".json"))
 
 
 def check_contamination():
     """
-    Checks for contamination between Train/Dev and Test using MinHash.
+    Checks for contamination between Train/Dev and Test.
+
+    Exact copies are found with a hash lookup first; only the remaining
+    documents go through MinHash near-duplicate detection. Fingerprints are
+    cached in indexes/.audit_cache.sqlite so unchanged files are not rescanned.
     """
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../indexes"))
 
@@ -76,26 +225,75 @@ def check_contamination():
     dev_dir = os.path.join(base_dir, "dev/documents")
     test_dir = os.path.join(base_dir, "test/documents")
 
-    print("[*] Computing signatures for Test set...")
-    test_sigs = load_file_signatures(test_dir)
-    if not test_sigs:
+    if not os.path.exists(base_dir):
         print("Test set is empty. No contamination possible.")
         return
 
-    print(f"Test set has {len(test_sigs)} unique files.")
+    manifest = PartitionManifest(os.path.join(base_dir, ".audit_cache.sqlite"))
+    try:
+        print("[*] Computing signatures for Test set...")
+        test_by_hash: Dict[str, List[str]] = {}
+        test_sigs: Dict[str, List[int]] = {}
+        for path in list_documents(test_dir):
+            fingerprint = manifest.fingerprint(path)
+            if fingerprint:
+                digest, signature = fingerprint
+                test_by_hash.setdefault(digest, []).append(path)
+                test_sigs[path] = signature
 
-    print("[*] Checking Train set...")
-    train_sigs = load_file_signatures(train_dir)
-    check_overlap(train_sigs, test_sigs, "Train")
+        if not test_sigs:
+            print("Test set is empty. No contamination possible.")
+            return
 
-    print("[*] Checking Dev set...")
-    dev_sigs = load_file_signatures(dev_dir)
-    check_overlap(dev_sigs, test_sigs, "Dev")
+        print(f"Test set has {len(test_sigs)} unique files.")
 
+        print("[*] Checking Train set...")
+        check_split(list_documents(train_dir), manifest, test_by_hash, test_sigs, "Train")
 
-def check_overlap(source_sigs: Dict[str, List[int]], target_sigs: Dict[str, List[int]], name: str):
-    threshold = 0.8  # Jaccard similarity threshold for "near duplicate"
+        print("[*] Checking Dev set...")
+        check_split(list_documents(dev_dir), manifest, test_by_hash, test_sigs, "Dev")
+    finally:
+        manifest.prune_missing()
+        manifest.close()
+
+
+def check_split(
+    source_paths: List[str],
+    manifest: PartitionManifest,
+    test_by_hash: Dict[str, List[str]],
+    test_sigs: Dict[str, List[int]],
+    name: str,
+):
+    """Report exact copies of Test documents, then near-duplicates of the rest."""
     violations = 0
+    remaining_sigs = {}
+
+    for s_path in source_paths:
+        # Exact copies skip MinHash, so only the rest get a signature
+        fingerprint = manifest.fingerprint(s_path, skip_signature_for=test_by_hash)
+        if not fingerprint:
+            continue
+        digest, signature = fingerprint
+        exact_targets = test_by_hash.get(digest)
+        if not exact_targets:
+            remaining_sigs[s_path] = signature
+            continue
+        for t_path in exact_targets:
+            print(f"CRITICAL: Exact copy of a Test document in {name}!")
+            print(f"  Source: {s_path}")
+            print(f"  Target: {t_path}")
+            violations += 1
+
+    check_overlap(remaining_sigs, test_sigs, name, violations)
+
+
+def check_overlap(
+    source_sigs: Dict[str, List[int]],
+    target_sigs: Dict[str, List[int]],
+    name: str,
+    violations: int = 0,
+):
+    threshold = 0.8  # Jaccard similarity threshold for "near duplicate"
 
     for s_path, s_sig in source_sigs.items():
         for t_path, t_sig in target_sigs.items():
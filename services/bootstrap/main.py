@@ -1,9 +1,9 @@
+import asyncio
 import os
 import sys
-import time
 
 
-def check_env():
+async def check_env():
     print("Checking environment variables...")
     required_vars = ["DATABASE_URL"]
     missing = [v for v in required_vars if not os.getenv(v)]
@@ -13,7 +13,7 @@ def check_env():
     return True
 
 
-def check_manifest():
+async def check_manifest():
     print("Checking ingestion manifest...")
     manifest_path = "ingest/manifest.jsonl"
     if not os.path.exists(manifest_path):
@@ -24,7 +24,7 @@ def check_manifest():
     return True
 
 
-def check_db():
+async def check_db():
     print("Checking database connection...")
     # Real check would use sqlalchemy/redis client
     # For now, just check if we can import them
@@ -34,12 +34,12 @@ def check_db():
     except ImportError:
         print("ERROR: Missing database drivers (sqlalchemy/redis)")
         return False
-    time.sleep(1)  # Simulate connection time
+    await asyncio.sleep(1)  # Simulate connection time
     print("Database connected.")
     return True
 
 
-def check_schemas():
+async def check_schemas():
     print("Verifying schemas...")
     # Simulate schema verification
     if not os.path.exists("schemas/ingest/document.json"):
@@ -49,19 +49,25 @@ def check_schemas():
     return True
 
 
-def main():
-    print("Starting system bootstrap...")
+async def run_checks() -> bool:
+    """Run bootstrap checks; the independent ones run concurrently."""
+    # Environment gates everything else
+    if not await check_env():
+        return False
 
-    if not check_env():
-        sys.exit(1)
+    results = await asyncio.gather(
+        check_db(), check_schemas(), check_manifest(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"ERROR: Bootstrap check raised {type(result).__name__}: {result}")
+    return all(result is True for result in results)
 
-    if not check_db():
-        sys.exit(1)
 
-    if not check_schemas():
-        sys.exit(1)
+def main():
+    print("Starting system bootstrap...")
 
-    if not check_manifest():
+    if not asyncio.run(run_checks()):
         sys.exit(1)
 
     print("Bootstrap complete. System ready.")
@@ -6,6 +6,31 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader, ConsoleMetricExporter
 from opentelemetry.sdk.resources import Resource
 
+# Batching knobs: fewer, larger exports instead of one write per span
+SPAN_BATCH_SETTINGS = {
+    "max_queue_size": 8192,
+    "max_export_batch_size": 512,
+    "schedule_delay_millis": 5000,
+    "export_timeout_millis": 30000,
+}
+METRIC_EXPORT_INTERVAL_MILLIS = 10000
+
+
+def make_span_processor() -> BatchSpanProcessor:
+    """
+    Build the span processor for this process.
+
+    Uses OTLP when OTEL_EXPORTER_OTLP_ENDPOINT is set, otherwise the console
+    exporter for local dev/test.
+    """
+    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter()
+    else:
+        exporter = ConsoleSpanExporter()
+    return BatchSpanProcessor(exporter, **SPAN_BATCH_SETTINGS)
+
 
 def setup_telemetry(service_name: str, version: str = "0.1.0"):
     """
@@ -21,14 +46,14 @@ def setup_telemetry(service_name: str, version: str = "0.1.0"):
     # TRACING
     trace_provider = TracerProvider(resource=resource)
 
-    # In production, swap ConsoleSpanExporter with OTLPSpanExporter
-    processor = BatchSpanProcessor(ConsoleSpanExporter())
-    trace_provider.add_span_processor(processor)
+    trace_provider.add_span_processor(make_span_processor())
 
     trace.set_tracer_provider(trace_provider)
 
     # METRICS
-    metric_reader = PeriodicExportingMetricReader(ConsoleMetricExporter())
+    metric_reader = PeriodicExportingMetricReader(
+        ConsoleMetricExporter(), export_interval_millis=METRIC_EXPORT_INTERVAL_MILLIS
+    )
     meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
 
     metrics.set_meter_provider(meter_provider)
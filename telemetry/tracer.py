@@ -1,34 +1,34 @@
+import threading
+
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider, Tracer
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-)
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-import os
+
+from telemetry.otel.setup import make_span_processor
+
+_setup_lock = threading.Lock()
+_setup_done = False
 
 
 def get_tracer(name: str) -> Tracer:
     """
     Returns a configured OpenTelemetry tracer.
+
+    The SDK provider is installed at most once per process, so repeated or
+    concurrent calls never stack extra BatchSpanProcessors.
     """
-    # Check if a provider is already set
-    provider = trace.get_tracer_provider()
-    if not isinstance(provider, TracerProvider):
-        _setup_tracer_provider()
+    global _setup_done
+    if not _setup_done:
+        with _setup_lock:
+            if not _setup_done:
+                # Respect a provider installed elsewhere (e.g. setup_telemetry)
+                if not isinstance(trace.get_tracer_provider(), TracerProvider):
+                    _setup_tracer_provider()
+                _setup_done = True
 
     return trace.get_tracer(name)
 
 
 def _setup_tracer_provider():
     provider = TracerProvider()
-
-    # Configure Exporter based on Env
-    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
-        processor = BatchSpanProcessor(OTLPSpanExporter())
-    else:
-        # Default to Console for local dev/test
-        processor = BatchSpanProcessor(ConsoleSpanExporter())
-
-    provider.add_span_processor(processor)
+    provider.add_span_processor(make_span_processor())
     trace.set_tracer_provider(provider)
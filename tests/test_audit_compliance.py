@@ -1,106 +1,211 @@
+import asyncio
 import pytest
-import sys
-import os
 import json
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass, field
+from typing import Optional
+from unittest.mock import MagicMock
 from models.task_spec import TaskSpec, Domain
 from models.workflow import WorkflowStep, WorkflowStatus
 from models.session import Session
 from runtime.orchestrator import Orchestrator
-from gateway.logging import AuditRecord
+from gateway.logging import AuditRecord, StructuredLogger
 
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+@dataclass
+class FakeKernelResult:
+    """Plain stand-in for KernelOutput."""
+
+    success: bool = True
+    result: dict = field(default_factory=dict)
+    error: Optional[str] = None
+    warnings: list = field(default_factory=list)
+
+
+class FakeKernel:
+    """Kernel stub that always succeeds."""
+
+    def execute(self, kernel_input):
+        return FakeKernelResult(success=True, result={"status": "ok"})
+
+
+@pytest.fixture
+def mocked_audit(monkeypatch):
+    """Replace the audit sink with a MagicMock for the duration of a test."""
+    mock = MagicMock()
+    monkeypatch.setattr(StructuredLogger, "log_audit_batch", mock)
+    return mock
+
+
+@pytest.fixture
+def stub_kernel(monkeypatch):
+    """Resolve every kernel id to FakeKernel."""
+    monkeypatch.setattr("runtime.orchestrator.get_kernel", lambda kernel_id: FakeKernel)
+    return FakeKernel
 
 
 @pytest.mark.asyncio
-async def test_audit_logging_success():
+async def test_audit_logging_success(mocked_audit, stub_kernel):
     """Test that successful steps generate audit logs."""
-    # Patch get_kernel to return a mock kernel class
-    with (
-        patch("gateway.logging.StructuredLogger.log_audit") as mock_log,
-        patch("runtime.orchestrator.get_kernel") as mock_get_kernel,
-    ):
-        # Setup mock kernel
-        mock_kernel_instance = MagicMock()
-        mock_kernel_instance.execute.return_value = MagicMock(success=True, result={"status": "ok"})
-        mock_kernel_class = MagicMock(return_value=mock_kernel_instance)
-        mock_get_kernel.return_value = mock_kernel_class
-
-        orchestrator = Orchestrator()
-        orchestrator.compliance.check_access = MagicMock(return_value=True)
-
-        session = Session(session_id="audit_sess", user_id="test_user")
-
-        spec = TaskSpec(
-            request_id="audit1",
-            user_input="Test",
-            domain=Domain.CODE,
-            selected_kernels=["mock_kernel"],
-        )
-        step = WorkflowStep(step_id="step1", description="Test", spec=spec)
+    orchestrator = Orchestrator()
+    orchestrator.compliance.check_access = MagicMock(return_value=True)
 
-        await orchestrator.run_step(step, session)
+    session = Session(session_id="audit_sess", user_id="test_user")
+
+    spec = TaskSpec(
+        request_id="audit1",
+        user_input="Test",
+        domain=Domain.CODE,
+        selected_kernels=["mock_kernel"],
+    )
+    step = WorkflowStep(step_id="step1", description="Test", spec=spec)
+
+    await orchestrator.run_step(step, session)
+    await orchestrator.audit_batcher.aclose()
 
-        assert mock_log.called
-        call_args = mock_log.call_args[0][0]
-        assert isinstance(call_args, AuditRecord)
-        assert call_args.action == "step_execution"
-        assert call_args.status == "SUCCESS"
-        assert call_args.actor_id == "test_user"
+    assert mocked_audit.called
+    call_args = mocked_audit.call_args[0][0][-1]
+    assert isinstance(call_args, AuditRecord)
+    assert call_args.action == "step_execution"
+    assert call_args.status == "SUCCESS"
+    assert call_args.actor_id == "test_user"
 
 
 @pytest.mark.asyncio
-async def test_compliance_blocking():
+async def test_compliance_blocking(mocked_audit):
     """Test that compliance checker blocks execution."""
-    with patch("gateway.logging.StructuredLogger.log_audit") as mock_log:
-        orchestrator = Orchestrator()
-        # Mock compliance to DENY
-        orchestrator.compliance.check_access = MagicMock(return_value=False)
+    orchestrator = Orchestrator()
+    # Mock compliance to DENY
+    orchestrator.compliance.check_access = MagicMock(return_value=False)
 
-        session = Session(session_id="comp_sess", user_id="bad_actor")
+    session = Session(session_id="comp_sess", user_id="bad_actor")
 
-        spec = TaskSpec(
-            request_id="comp1",
-            user_input="Sensitive Op",
-            domain=Domain.CODE,
-            selected_kernels=["project_mgmt_v1"],
-        )
-        step = WorkflowStep(step_id="step_sensitive", description="Sensitive", spec=spec)
+    spec = TaskSpec(
+        request_id="comp1",
+        user_input="Sensitive Op",
+        domain=Domain.CODE,
+        selected_kernels=["project_mgmt_v1"],
+    )
+    step = WorkflowStep(step_id="step_sensitive", description="Sensitive", spec=spec)
 
-        result = await orchestrator.run_step(step, session)
+    result = await orchestrator.run_step(step, session)
+    await orchestrator.audit_batcher.aclose()
 
-        assert result.status == WorkflowStatus.BLOCKED
-        assert "Compliance violation" in result.error
+    assert result.status == WorkflowStatus.BLOCKED
+    assert "Compliance violation" in result.error
 
-        # Verify audit log for BLOCK
-        assert mock_log.called
-        call_args = mock_log.call_args[0][0]
-        assert call_args.status == "BLOCKED"
-        assert "access_control" in call_args.policy_violations
+    # Verify audit log for BLOCK
+    assert mocked_audit.called
+    call_args = mocked_audit.call_args[0][0][-1]
+    assert call_args.status == "BLOCKED"
+    assert "access_control" in call_args.policy_violations
 
 
 @pytest.mark.asyncio
-async def test_gate_blocking_audit():
+async def test_gate_blocking_audit(mocked_audit):
     """Test that gate failures generate audit logs."""
-    with patch("gateway.logging.StructuredLogger.log_audit") as mock_log:
-        orchestrator = Orchestrator()
-        orchestrator.compliance.check_access = MagicMock(return_value=True)
-        session = Session(session_id="gate_audit_sess", user_id="user")
-
-        # Spec that fails a gate
-        spec = TaskSpec(
-            request_id="block2",
-            user_input="Write secret_key now",
-            domain=Domain.CODE,
-            required_gates=["file_write_gate"],
-        )
-        step = WorkflowStep(step_id="step_gate_fail", description="Fail Gate", spec=spec)
+    orchestrator = Orchestrator()
+    orchestrator.compliance.check_access = MagicMock(return_value=True)
+    session = Session(session_id="gate_audit_sess", user_id="user")
+
+    # Spec that fails a gate
+    spec = TaskSpec(
+        request_id="block2",
+        user_input="Write secret_key now",
+        domain=Domain.CODE,
+        required_gates=["file_write_gate"],
+    )
+    step = WorkflowStep(step_id="step_gate_fail", description="Fail Gate", spec=spec)
+
+    await orchestrator.run_step(step, session)
+    await orchestrator.audit_batcher.aclose()
+
+    # Should call log_audit_batch for the BLOCK
+    assert mocked_audit.called
+    call_args = mocked_audit.call_args[0][0][-1]
+    assert call_args.status == "BLOCKED"
+    assert "Gate Failure" in call_args.details["reason"]
 
-        await orchestrator.run_step(step, session)
 
-        # Should call log_audit for the BLOCK
-        assert mock_log.called
-        call_args = mock_log.call_args[0][0]
-        assert call_args.status == "BLOCKED"
-        assert "Gate Failure" in call_args.details["reason"]
+@pytest.mark.asyncio
+async def test_audit_batcher_flushes_in_batches(mocked_audit):
+    """Records are buffered off the request path and written in max_batch chunks."""
+    from gateway.audit import AuditBatcher
+
+    batcher = AuditBatcher(StructuredLogger("test"), max_batch=2, flush_interval=60)
+    for i in range(3):
+        batcher.put_nowait(AuditRecord(event_id=str(i), actor_id="u", action="a", status="SUCCESS"))
+    assert not mocked_audit.called  # Nothing written synchronously
+
+    await asyncio.wait_for(batcher.aclose(), timeout=5)
+
+    batches = [[r.event_id for r in c[0][0]] for c in mocked_audit.call_args_list]
+    assert batches == [["0", "1"], ["2"]]
+
+
+def test_audit_batcher_keeps_records_on_write_failure(mocked_audit):
+    """A failing sink must not drop the batch it was handed."""
+    from gateway.audit import AuditBatcher
+
+    mocked_audit.side_effect = [OSError, None]
+    batcher = AuditBatcher(StructuredLogger("test"))
+    batcher._pending.append(AuditRecord(event_id="x", actor_id="u", action="a", status="SUCCESS"))
+    with pytest.raises(OSError):
+        batcher.flush()
+    batcher.flush()
+    assert mocked_audit.call_args[0][0][0].event_id == "x"
+    assert batcher._pending == []
+
+
+def test_run_workflow_flushes_audit_records(mocked_audit):
+    """Records are written by the end of run_workflow even without aclose()."""
+    from models.workflow import Workflow
+
+    orchestrator = Orchestrator()
+    orchestrator.compliance.check_access = MagicMock(return_value=False)
+    session = Session(session_id="flush_sess", user_id="u")
+    spec = TaskSpec(request_id="f1", user_input="x", domain=Domain.CODE)
+    step = WorkflowStep(step_id="s1", description="x", spec=spec)
+    workflow = Workflow(workflow_id="wf_flush", name="flush", steps=[step])
+
+    asyncio.run(orchestrator.run_workflow(workflow, session))
+
+    assert mocked_audit.called
+    assert orchestrator.audit_batcher._pending == []
+
+
+@pytest.mark.asyncio
+async def test_access_decisions_are_cached(mocked_audit):
+    """Repeated (user, step, action) checks hit the policy only once."""
+    orchestrator = Orchestrator()
+    orchestrator.compliance.check_access = MagicMock(return_value=False)
+    session = Session(session_id="cache_sess", user_id="u")
+    spec = TaskSpec(request_id="c1", user_input="x", domain=Domain.CODE)
+
+    for _ in range(3):
+        step = WorkflowStep(step_id="same_step", description="x", spec=spec)
+        await orchestrator.run_step(step, session)
+    assert orchestrator.compliance.check_access.call_count == 1
+
+    orchestrator.invalidate_access_cache()
+    await orchestrator.run_step(
+        WorkflowStep(step_id="same_step", description="x", spec=spec), session
+    )
+    assert orchestrator.compliance.check_access.call_count == 2
+    await orchestrator.audit_batcher.aclose()
+
+
+def test_audit_batch_lines_are_valid_jsonl(capsys):
+    """Each batched audit record is written as one parseable JSON line."""
+    records = [
+        AuditRecord(event_id=f"e{i}", actor_id="u", action="a", status="SUCCESS", details={"i": i})
+        for i in range(2)
+    ]
+    StructuredLogger("orchestrator").log_audit_batch(records)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    first = json.loads(lines[0])
+    assert first["event"] == "audit"
+    assert first["component"] == "orchestrator"
+    assert first["audit_record"]["details"] == {"i": 0}
+    assert first["timestamp"] == records[0].timestamp.isoformat()
@@ -0,0 +1,208 @@
+"""
+Tests for the contamination audit script's file discovery and signatures.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from contamination_audit import (
+    PartitionManifest,
+    compute_jaccard_similarity,
+    compute_minhash,
+    iter_files,
+    load_file_signatures,
+)
+
+
+def _write_doc(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"content": content}))
+
+
+class TestIterFiles:
+    """Test the scandir-based walker."""
+
+    def test_finds_nested_json(self, tmp_path):
+        _write_doc(tmp_path / "a.json", "alpha")
+        _write_doc(tmp_path / "sub" / "deep" / "b.json", "beta")
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        found = sorted(Path(p).name for p in iter_files(str(tmp_path), ".json"))
+        assert found == ["a.json", "b.json"]
+
+    def test_skips_hidden_entries(self, tmp_path):
+        _write_doc(tmp_path / ".hidden.json", "hidden")
+        _write_doc(tmp_path / ".cache" / "c.json", "cached")
+        _write_doc(tmp_path / "visible.json", "visible")
+
+        found = [Path(p).name for p in iter_files(str(tmp_path), ".json")]
+        assert found == ["visible.json"]
+
+    def test_follows_symlinked_files(self, tmp_path):
+        target = tmp_path / "outside" / "real.json"
+        _write_doc(target, "linked")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        os.symlink(target, docs / "link.json")
+
+        found = [Path(p).name for p in iter_files(str(docs), ".json")]
+        assert found == ["link.json"]
+
+    def test_missing_root_yields_nothing(self, tmp_path):
+        assert list(iter_files(str(tmp_path / "missing"), ".json")) == []
+
+
+class TestLoadFileSignatures:
+    """Test signature loading over a directory tree."""
+
+    def test_signatures_keyed_by_path(self, tmp_path):
+        _write_doc(tmp_path / "a.json", "the quick brown fox")
+        _write_doc(tmp_path / "sub" / "b.json", "")
+
+        sigs = load_file_signatures(str(tmp_path))
+        assert list(sigs) == [str(tmp_path / "a.json")]
+        assert len(sigs[str(tmp_path / "a.json")]) == 100
+
+
+class TestMinHash:
+    """Test MinHash signatures and similarity estimates."""
+
+    def test_identical_texts_match(self):
+        sig = compute_minhash("The hydrostatic pressure at depth h is rho g h.")
+        assert compute_jaccard_similarity(sig, sig) == 1.0
+        assert sig == compute_minhash("The  hydrostatic pressure at depth h is RHO g h.")
+
+    def test_unrelated_texts_diverge(self):
+        a = compute_minhash("The hydrostatic pressure at depth h is rho g h.")
+        b = compute_minhash("Gantt charts track milestones across project sprints.")
+        assert compute_jaccard_similarity(a, b) < 0.3
+
+    def test_near_duplicates_are_similar(self):
+        a = compute_minhash("The hydrostatic pressure at depth h is rho times g times h.")
+        b = compute_minhash("The hydrostatic pressure at depth h is rho times g times h!")
+        assert compute_jaccard_similarity(a, b) > 0.8
+
+
+class TestCheckSplit:
+    """Test the exact-hash pre-filter in front of MinHash."""
+
+    def test_exact_copies_skip_minhash(self, tmp_path, capsys, monkeypatch):
+        import contamination_audit
+
+        text = "The hydrostatic pressure at depth h is rho times g times h."
+        other = "Unrelated gantt chart milestones."
+        _write_doc(tmp_path / "train" / "a.json", text)
+        _write_doc(tmp_path / "train" / "b.json", other)
+        test_by_hash = {contamination_audit.content_digest(text): ["test/a.json"]}
+        test_sigs = {"test/a.json": compute_minhash(text)}
+
+        calls = []
+        real_minhash = contamination_audit.compute_minhash
+        monkeypatch.setattr(
+            contamination_audit, "compute_minhash", lambda c: calls.append(c) or real_minhash(c)
+        )
+        manifest = PartitionManifest(":memory:")
+        contamination_audit.check_split(
+            sorted(iter_files(str(tmp_path / "train"), ".json")),
+            manifest,
+            test_by_hash,
+            test_sigs,
+            "Train",
+        )
+
+        out = capsys.readouterr().out
+        assert "Exact copy" in out
+        assert "Found 1 potential contamination" in out
+        assert calls == [other]
+
+    def test_each_document_read_once_on_cold_cache(self, tmp_path, capsys, monkeypatch):
+        import contamination_audit
+
+        _write_doc(tmp_path / "train" / "a.json", "Unrelated gantt chart milestones.")
+        _write_doc(tmp_path / "train" / "b.json", "Sprint velocity and burndown charts.")
+        test_text = "The hydrostatic pressure at depth h is rho times g times h."
+        test_by_hash = {contamination_audit.content_digest(test_text): ["test/a.json"]}
+        test_sigs = {"test/a.json": compute_minhash(test_text)}
+
+        reads = []
+        real_read = contamination_audit.read_content
+        monkeypatch.setattr(
+            contamination_audit, "read_content", lambda p: reads.append(p) or real_read(p)
+        )
+        paths = sorted(iter_files(str(tmp_path / "train"), ".json"))
+        contamination_audit.check_split(
+            paths, PartitionManifest(":memory:"), test_by_hash, test_sigs, "Train"
+        )
+
+        assert sorted(reads) == paths
+        assert "No near-duplicates found in Train" in capsys.readouterr().out
+
+
+class TestPartitionManifest:
+    """Test the incremental fingerprint cache."""
+
+    def test_unchanged_files_are_not_reread(self, tmp_path, monkeypatch):
+        import contamination_audit
+
+        doc = tmp_path / "a.json"
+        _write_doc(doc, "the quick brown fox")
+        db = str(tmp_path / ".audit_cache.sqlite")
+
+        manifest = PartitionManifest(db)
+        first = manifest.fingerprint(str(doc))
+        manifest.close()
+
+        monkeypatch.setattr(contamination_audit, "read_content", lambda p: pytest.fail("reread"))
+        manifest = PartitionManifest(db)
+        assert manifest.fingerprint(str(doc)) == first
+        manifest.close()
+
+    def test_modified_files_are_refreshed(self, tmp_path):
+        doc = tmp_path / "a.json"
+        _write_doc(doc, "the quick brown fox")
+        manifest = PartitionManifest(str(tmp_path / ".audit_cache.sqlite"))
+        first = manifest.fingerprint(str(doc))
+
+        _write_doc(doc, "a completely different and longer document body")
+        assert manifest.fingerprint(str(doc))[0] != first[0]
+        manifest.close()
+
+    def test_signatures_from_other_parameters_are_recomputed(self, tmp_path, monkeypatch):
+        import contamination_audit
+
+        doc = tmp_path / "a.json"
+        _write_doc(doc, "the quick brown fox")
+        db = str(tmp_path / ".audit_cache.sqlite")
+
+        manifest = PartitionManifest(db)
+        first = manifest.fingerprint(str(doc))
+        manifest.close()
+
+        reads = []
+        real_read = contamination_audit.read_content
+        monkeypatch.setattr(
+            contamination_audit, "read_content", lambda p: reads.append(p) or real_read(p)
+        )
+        monkeypatch.setattr(contamination_audit, "SIGNATURE_PARAMS", "other-scheme")
+        manifest = PartitionManifest(db)
+        assert manifest.fingerprint(str(doc)) == first
+        assert reads == [str(doc)]
+        manifest.close()
+
+    def test_prune_missing_drops_deleted_files(self, tmp_path):
+        kept, deleted = tmp_path / "kept.json", tmp_path / "deleted.json"
+        _write_doc(kept, "the quick brown fox")
+        _write_doc(deleted, "jumps over the lazy dog")
+        manifest = PartitionManifest(str(tmp_path / ".audit_cache.sqlite"))
+        manifest.fingerprint(str(kept))
+        manifest.fingerprint(str(deleted))
+
+        deleted.unlink()
+        manifest.prune_missing()
+
+        rows = manifest._conn.execute("SELECT path FROM fingerprints").fetchall()
+        assert rows == [(str(kept),)]
+        manifest.close()
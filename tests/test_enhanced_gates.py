@@ -1,15 +1,11 @@
 import pytest
-import sys
-import os
 from models.task_spec import TaskSpec, Domain, TaskRequest
 from models.workflow import WorkflowStep, WorkflowStatus
 from models.session import Session
 from validator.gates import experiment_safety_gate, file_write_gate, Decision
+from validator.term_scanner import TermScanner
 from runtime.orchestrator import Orchestrator
 
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 
 def test_experiment_safety_gate_sample_size():
     """Test sample size validation."""
@@ -39,6 +35,20 @@ def test_experiment_safety_gate_sample_size():
     assert decision_valid.decision == Decision.ACCEPT
 
 
+def test_experiment_safety_gate_sample_size_scan_is_bounded():
+    """Sample-size parsing stays linear and ignores absurd digit runs."""
+
+    def decide(text):
+        spec = TaskSpec(request_id="n", user_input=text, domain=Domain.EXPERIMENT)
+        return experiment_safety_gate(spec).decision
+
+    assert decide("sample  size (n = 5) for the pilot") == Decision.WARN
+    # Like the old ".*?" pattern, the match never spans a line break
+    assert decide("collect one sample\nsize 5 vials") == Decision.ACCEPT
+    assert decide("sample size " + "9" * 5000) == Decision.ACCEPT
+    assert decide("sample size " * 20000) == Decision.ACCEPT
+
+
 def test_experiment_safety_gate_irb():
     """Test human subjects checks."""
     # Human subjects without IRB
@@ -79,6 +89,73 @@ def test_file_write_gate_allows_safe():
     assert decision.decision == Decision.ACCEPT
 
 
+def test_term_scanner_finds_nested_terms():
+    """Terms that are prefixes or substrings of a longer match are still reported."""
+    scanner = TermScanner(("lb", "lbf", "specific weight", "weight"))
+    assert scanner.find("a 10 lbf load with specific weight") == {
+        "lb",
+        "lbf",
+        "specific weight",
+        "weight",
+    }
+    assert scanner.find("no units here") == set()
+    assert scanner.find("lb") == {"lb"}
+    assert scanner.find("l") == set()
+    assert TermScanner(()).find("lb") == set()
+
+
+def test_policy_loads_are_cached_until_reset():
+    """Gates share one parsed policy until reset_gate_caches() is called."""
+    from validator.gates import reset_gate_caches
+    from validator.loader import load_policy
+
+    policy = load_policy("unit_disambiguation")
+    assert load_policy("unit_disambiguation") is policy
+
+    reset_gate_caches()
+    reloaded = load_policy("unit_disambiguation")
+    assert reloaded is not policy
+    assert reloaded == policy
+
+
+def test_unit_gate_ascii_and_unicode_paths_agree():
+    """The str.find fast path and the regex fallback flag the same units."""
+    from validator.gates import unit_consistency_gate
+
+    def decide(text):
+        spec = TaskSpec(request_id="units", user_input=text, domain=Domain.PHYSICS)
+        return unit_consistency_gate(spec).decision
+
+    # ASCII input takes the fast path; the accented variants take the regex path
+    assert decide("Convert 10 LB to kg") == Decision.CLARIFY
+    assert decide("Convert 10 LB to kg, café") == Decision.CLARIFY
+    assert decide("Convert 10 lbf to kg") == Decision.ACCEPT
+    assert decide("Convert 10 lbf to kg, café") == Decision.ACCEPT
+    assert decide("a_lb_b") == Decision.ACCEPT
+
+
+def test_run_gates_stop_on_block():
+    """stop_on_block skips the gates after the first blocking decision."""
+    from validator.gates import run_gates
+
+    spec = TaskSpec(
+        request_id="stop1",
+        user_input="Convert 10 lb of water with specific weight",
+        domain=Domain.PHYSICS,
+        required_gates=["schema_gate", "unit_consistency_gate", "ambiguity_gate"],
+    )
+    all_decisions = run_gates(spec)
+    assert [d.gate_id for d in all_decisions] == [
+        "schema_gate",
+        "unit_consistency_gate",
+        "ambiguity_gate",
+    ]
+
+    stopped = run_gates(spec, stop_on_block=True)
+    assert [d.gate_id for d in stopped] == ["schema_gate", "unit_consistency_gate"]
+    assert stopped[-1].is_blocking()
+
+
 @pytest.mark.asyncio
 async def test_orchestrator_enforces_gates():
     """Test that orchestrator blocks execution if gates fail."""
@@ -4,12 +4,6 @@ Tests for Gates module.
 Verifies lab ambiguity gate, experiment safety gate, and gate pipeline.
 """
 
-import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 from router.gates import (
     Gate,
     GateDecision,
@@ -73,6 +67,13 @@ class TestLabAmbiguityGate:
         assert result.decision == GateDecision.CLARIFY
         assert len(result.metadata["ambiguous_terms"]) >= 2
 
+    def test_overlapping_terms_detected(self):
+        """A term nested inside another ('rate' in 'response rate') is still found."""
+        gate = LabAmbiguityGate()
+        result = gate.evaluate({"raw_input": "Report the response rate"})
+
+        assert result.metadata["ambiguous_terms"] == ["response rate", "rate"]
+
 
 class TestExperimentSafetyGate:
     """Test experiment safety validation gate."""
@@ -258,49 +259,40 @@ class TestGatePipeline:
 
         assert len(results) == len(pipeline.gates)
 
+    def test_pipeline_shares_one_token_view(self):
+        """The pipeline lowercases and scans the input once for all gates."""
+        seen = []
+
+        class RecordingGate(Gate):
+            def evaluate(self, task_spec):
+                seen.append(self._text_view(task_spec))
+                return super().evaluate(task_spec)
+
+        pipeline = GatePipeline([RecordingGate(), LabAmbiguityGate(), RecordingGate()])
+        pipeline.evaluate_all({"raw_input": "Check the Response Rate"})
 
-def run_tests():
-    """Run all gate tests."""
-    import traceback
-
-    test_classes = [
-        TestLabAmbiguityGate,
-        TestExperimentSafetyGate,
-        TestDataQualityGate,
-        TestGateRegistry,
-        TestGatePipeline,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
-if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+        assert seen[0] is seen[1]
+        assert seen[0].lower == "check the response rate"
+        assert seen[0].ambiguous_hits == {"response rate", "rate"}
+
+    def test_pipeline_view_keeps_prefix_terms(self, monkeypatch):
+        """A term that starts where a longer term starts is still found via `_tv`."""
+        monkeypatch.setitem(
+            LabAmbiguityGate.AMBIGUOUS_TERMS,
+            "sample size",
+            {"meanings": ["planned n", "achieved n"], "clarify": "Planned or achieved?"},
+        )
+        views = []
+
+        class RecordingGate(Gate):
+            def evaluate(self, task_spec):
+                views.append(task_spec["_tv"])
+                return super().evaluate(task_spec)
+
+        pipeline = GatePipeline([RecordingGate(), LabAmbiguityGate()])
+        result = pipeline.evaluate({"raw_input": "What Sample Size at this rate"})
+
+        assert views[0].ambiguous_hits == {"sample", "sample size", "rate"}
+        assert result.decision == GateDecision.CLARIFY
+        assert "sample size" in result.metadata["ambiguous_terms"]
+        assert "rate" in result.metadata["ambiguous_terms"]
@@ -0,0 +1,47 @@
+"""
+Tests for the ingestion pipeline contracts and stages.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from pipelines.contracts import PipelineContext
+from pipelines.ingestion import PartitioningStage, RawImportStage
+from schemas.ingest.contracts import Partition
+
+
+def _context() -> PipelineContext:
+    return PipelineContext(run_id="test-run", dry_run=True)
+
+
+class TestIngestContracts:
+    """Test the frozen ingest models."""
+
+    def test_document_is_frozen(self):
+        doc = RawImportStage(_context()).run(
+            {"content": "Physics text", "source_name": "src", "source_path": "/raw/a.pdf"}
+        )
+        with pytest.raises(ValidationError):
+            doc.content = "changed"
+
+    def test_partitioning_returns_updated_copy(self):
+        doc = RawImportStage(_context()).run(
+            {"content": "Physics text", "source_name": "src", "source_path": "/raw/a.pdf"}
+        )
+        partitioned = PartitioningStage(_context()).run(doc)
+
+        assert doc.partition == Partition.UNASSIGNED
+        assert partitioned.partition != Partition.UNASSIGNED
+        assert partitioned.id == doc.id
+
+
+class TestContentHash:
+    """Test the dedup fingerprint."""
+
+    def test_hash_is_stable_128_bit_hex(self):
+        from pipelines.ingestion import compute_content_hash
+
+        h = compute_content_hash("Physics text")
+        assert h == compute_content_hash("Physics text")
+        assert len(h) == 32
+        int(h, 16)
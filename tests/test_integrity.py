@@ -8,11 +8,8 @@ Ensures that:
 - Kernel interfaces match registry declarations
 """
 
+import pytest
 import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from validator.integrity import (
     validate_kernel_references,
@@ -32,15 +29,12 @@ class TestKernelReferences:
 
     def test_kernels_are_importable(self):
         """All implemented kernels should be importable."""
-        from validator.integrity import KERNEL_IMPLEMENTATIONS
-        import importlib
+        from validator.integrity import KERNEL_IMPLEMENTATIONS, resolve_kernel_class
 
         for kernel_id, impl in KERNEL_IMPLEMENTATIONS.items():
             if impl is None:
                 continue  # Skip planned kernels
-            module_path, class_name = impl
-            module = importlib.import_module(module_path)
-            kernel_class = getattr(module, class_name, None)
+            kernel_class = resolve_kernel_class(*impl)
             assert kernel_class is not None, f"Kernel {kernel_id} class not found"
 
 
@@ -88,8 +82,7 @@ class TestKernelInterface:
     def test_kernel_ids_match_registry(self):
         """Kernel class kernel_id should match registry entry."""
         from validator.loader import load_registry
-        from validator.integrity import KERNEL_IMPLEMENTATIONS
-        import importlib
+        from validator.integrity import KERNEL_IMPLEMENTATIONS, resolve_kernel_class
 
         registry = load_registry()
         for kernel in registry.get("kernels", []):
@@ -98,14 +91,23 @@ class TestKernelInterface:
                 impl = KERNEL_IMPLEMENTATIONS[kernel_id]
                 if impl is None:
                     continue  # Skip planned kernels
-                module_path, class_name = impl
-                module = importlib.import_module(module_path)
-                kernel_class = getattr(module, class_name)
+                kernel_class = resolve_kernel_class(*impl)
                 assert kernel_class.kernel_id == kernel_id, (
                     f"Kernel {kernel_id} class has wrong kernel_id"
                 )
 
 
+class TestRegistryCache:
+    """Test that the registry file is parsed once per process."""
+
+    def test_load_registry_is_memoized(self):
+        from validator.loader import load_registry
+
+        assert load_registry() is load_registry()
+        load_registry.cache_clear()
+        assert load_registry().get("kernels")
+
+
 class TestFullIntegrity:
     """Test complete referential integrity."""
 
@@ -114,48 +116,6 @@ class TestFullIntegrity:
         assert is_valid, f"Integrity errors: {errors}"
 
 
-def run_tests():
-    """Run all integrity tests."""
-    import traceback
-
-    test_classes = [
-        TestKernelReferences,
-        TestSchemaReferences,
-        TestPolicyReferences,
-        TestKernelInterface,
-        TestFullIntegrity,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    # Extra arguments are passed through, e.g. `-n auto` to run in parallel
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -5,83 +5,75 @@ Verifies that lab-specific requests are routed to the correct domains
 and trigger appropriate gates and kernels.
 """
 
-import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+import pytest
 
 from router.classifier import classify_task, extract_features
 from models.task_spec import TaskRequest, Domain
 
 
+EXPERIMENT_PROMPTS = [
+    "Design a randomized control group experiment",
+    "What is the best protocol for my hypothesis test?",
+    "Create a double-blind study with treatment arms",
+    "IRB approval for cohort study",
+]
+SURVEY_PROMPTS = [
+    "Design a questionnaire with likert scale questions",
+    "Calculate sample size for margin of error 5%",
+    "Analyze demographics of respondents",
+    "Reduce non-response in stratified sampling",
+]
+PROJECT_PROMPTS = [
+    "Create a gantt chart for the project",
+    "Calculate critical path for dependencies",
+    "Assign resources to sprint deliverables",
+    "Track milestones and deadlines",
+]
+OPERATIONS_PROMPTS = [
+    "Design a workflow for inventory management",
+    "Write an SOP for escalation procedures",
+    "Improve throughput by reducing bottlenecks",
+    "Schedule shifts for capacity planning",
+]
+ANALYSIS_PROMPTS = [
+    "Run a regression on this dataset",
+    "Calculate p-value and confidence interval",
+    "Create a pivot table with aggregations",
+    "Check for outliers in the distribution",
+]
+
+
+def _route(prompt: str) -> Domain:
+    return classify_task(TaskRequest(request_id="test", user_input=prompt)).domain
+
+
 class TestLabDomainRouting:
-    """Test routing to lab domains."""
+    """Test routing to lab domains (one test case per prompt)."""
 
-    def test_experiment_design_keywords(self):
+    @pytest.mark.parametrize("prompt", EXPERIMENT_PROMPTS)
+    def test_experiment_design_keywords(self, prompt):
         """Experiment design keywords should route to experiment domain."""
-        prompts = [
-            "Design a randomized control group experiment",
-            "What is the best protocol for my hypothesis test?",
-            "Create a double-blind study with treatment arms",
-            "IRB approval for cohort study",
-        ]
-        for prompt in prompts:
-            request = TaskRequest(request_id="test", user_input=prompt)
-            spec = classify_task(request)
-            assert spec.domain == Domain.EXPERIMENT, f"'{prompt}' should route to experiment"
-
-    def test_survey_keywords(self):
+        assert _route(prompt) == Domain.EXPERIMENT
+
+    @pytest.mark.parametrize("prompt", SURVEY_PROMPTS)
+    def test_survey_keywords(self, prompt):
         """Survey research keywords should route to survey domain."""
-        prompts = [
-            "Design a questionnaire with likert scale questions",
-            "Calculate sample size for margin of error 5%",
-            "Analyze demographics of respondents",
-            "Reduce non-response in stratified sampling",
-        ]
-        for prompt in prompts:
-            request = TaskRequest(request_id="test", user_input=prompt)
-            spec = classify_task(request)
-            assert spec.domain == Domain.SURVEY, f"'{prompt}' should route to survey"
-
-    def test_project_keywords(self):
+        assert _route(prompt) == Domain.SURVEY
+
+    @pytest.mark.parametrize("prompt", PROJECT_PROMPTS)
+    def test_project_keywords(self, prompt):
         """Project management keywords should route to project domain."""
-        prompts = [
-            "Create a gantt chart for the project",
-            "Calculate critical path for dependencies",
-            "Assign resources to sprint deliverables",
-            "Track milestones and deadlines",
-        ]
-        for prompt in prompts:
-            request = TaskRequest(request_id="test", user_input=prompt)
-            spec = classify_task(request)
-            assert spec.domain == Domain.PROJECT, f"'{prompt}' should route to project"
-
-    def test_operations_keywords(self):
+        assert _route(prompt) == Domain.PROJECT
+
+    @pytest.mark.parametrize("prompt", OPERATIONS_PROMPTS)
+    def test_operations_keywords(self, prompt):
         """Operations keywords should route to operations domain."""
-        prompts = [
-            "Design a workflow for inventory management",
-            "Write an SOP for escalation procedures",
-            "Improve throughput by reducing bottlenecks",
-            "Schedule shifts for capacity planning",
-        ]
-        for prompt in prompts:
-            request = TaskRequest(request_id="test", user_input=prompt)
-            spec = classify_task(request)
-            assert spec.domain == Domain.OPERATIONS, f"'{prompt}' should route to operations"
-
-    def test_analysis_keywords(self):
+        assert _route(prompt) == Domain.OPERATIONS
+
+    @pytest.mark.parametrize("prompt", ANALYSIS_PROMPTS)
+    def test_analysis_keywords(self, prompt):
         """Data analysis keywords should route to analysis domain."""
-        prompts = [
-            "Run a regression on this dataset",
-            "Calculate p-value and confidence interval",
-            "Create a pivot table with aggregations",
-            "Check for outliers in the distribution",
-        ]
-        for prompt in prompts:
-            request = TaskRequest(request_id="test", user_input=prompt)
-            spec = classify_task(request)
-            assert spec.domain == Domain.ANALYSIS, f"'{prompt}' should route to analysis"
+        assert _route(prompt) == Domain.ANALYSIS
 
 
 class TestLabAmbiguousTerms:
@@ -139,48 +131,3 @@ class TestLabKernelSelection:
         spec = classify_task(request)
         assert "statistics_v1" in spec.selected_kernels
         assert "data_summary_v1" in spec.selected_kernels
-
-
-def run_tests():
-    """Run all lab domain tests."""
-    import traceback
-
-    test_classes = [
-        TestLabDomainRouting,
-        TestLabAmbiguousTerms,
-        TestLabKernelSelection,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
-if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
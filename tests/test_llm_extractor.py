@@ -5,11 +5,8 @@ Verifies local extraction, OpenRouter integration, caching, and determinism.
 """
 
 import sys
-from pathlib import Path
-import os
 
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+import pytest
 
 from router.llm_extractor import (
     LLMSpecExtractor,
@@ -17,15 +14,28 @@ from router.llm_extractor import (
     ExtractionMode,
     ExtractionResult,
     extract_spec,
+    httpx_available,
 )
 
 
+@pytest.fixture(scope="module")
+def shared_extractor():
+    """One default-config extractor for the whole module."""
+    return LLMSpecExtractor()
+
+
+@pytest.fixture
+def extractor(shared_extractor):
+    """The shared extractor, with its cache cleared after each test."""
+    yield shared_extractor
+    shared_extractor.clear_cache()
+
+
 class TestLocalExtraction:
     """Test local (placeholder) extraction."""
 
-    def test_simple_extraction(self):
+    def test_simple_extraction(self, extractor):
         """Simple input should extract successfully."""
-        extractor = LLMSpecExtractor()
         result = extractor.extract("Calculate the sample size for my experiment")
 
         assert result.success
@@ -33,10 +43,8 @@ class TestLocalExtraction:
         assert result.mode_used == ExtractionMode.LOCAL
         assert "domain" in result.spec
 
-    def test_domain_detection(self):
+    def test_domain_detection(self, extractor):
         """Domain should be detected from keywords."""
-        extractor = LLMSpecExtractor()
-
         # Experiment domain
         result = extractor.extract("Design an experiment with control group")
         assert result.spec["domain"] == "experiment"
@@ -49,10 +57,8 @@ class TestLocalExtraction:
         result = extractor.extract("Analyze correlation between variables")
         assert result.spec["domain"] == "analysis"
 
-    def test_complexity_detection(self):
+    def test_complexity_detection(self, extractor):
         """Complexity should be detected from input length."""
-        extractor = LLMSpecExtractor()
-
         # Short = low complexity
         result = extractor.extract("Calculate mean")
         assert result.spec["complexity"] == "low"
@@ -65,42 +71,37 @@ class TestLocalExtraction:
         )
         assert result.spec["complexity"] in ["medium", "high"]
 
-    def test_ambiguity_detection(self):
+    def test_ambiguity_detection(self, extractor):
         """Ambiguous terms should be flagged."""
-        extractor = LLMSpecExtractor()
         result = extractor.extract("What is the power of my sample?")
 
         assert result.success
         assert len(result.spec["ambiguities"]) > 0
-        assert any("power" in a or "sample" in a for a in result.spec["ambiguities"])
+        # Local messages quote the flagged term: "'power' may have multiple meanings..."
+        flagged = {message.split("'")[1] for message in result.spec["ambiguities"]}
+        assert {"power", "sample"} <= flagged
 
 
 class TestCaching:
     """Test extraction caching for determinism."""
 
-    def test_cache_hit(self):
+    def test_cache_hit(self, extractor):
         """Same input should return cached result."""
-        extractor = LLMSpecExtractor()
-
         result1 = extractor.extract("Test input")
         result2 = extractor.extract("Test input")
 
         assert result1.input_hash == result2.input_hash
         assert result2.cached is True
 
-    def test_different_inputs_not_cached(self):
+    def test_different_inputs_not_cached(self, extractor):
         """Different inputs should not share cache."""
-        extractor = LLMSpecExtractor()
-
         result1 = extractor.extract("First input")
         result2 = extractor.extract("Second input")
 
         assert result1.input_hash != result2.input_hash
 
-    def test_cache_clear(self):
+    def test_cache_clear(self, extractor):
         """Cache should be clearable."""
-        extractor = LLMSpecExtractor()
-
         result1 = extractor.extract("Test input")
         extractor.clear_cache()
         result2 = extractor.extract("Test input")
@@ -111,16 +112,14 @@ class TestCaching:
 class TestModeSelection:
     """Test automatic mode selection."""
 
-    def test_short_input_uses_local(self):
+    def test_short_input_uses_local(self, extractor):
         """Short, simple input should use local mode."""
-        extractor = LLMSpecExtractor()
         result = extractor.extract("Calculate mean of dataset")
 
         assert result.mode_used == ExtractionMode.LOCAL
 
-    def test_force_mode(self):
+    def test_force_mode(self, extractor):
         """Force mode should override auto-selection."""
-        extractor = LLMSpecExtractor()
         result = extractor.extract("Simple task", force_mode=ExtractionMode.LOCAL)
 
         assert result.mode_used == ExtractionMode.LOCAL
@@ -136,19 +135,15 @@ class TestDeterminism:
         assert config.temperature == 0.0
         assert config.seed == 42
 
-    def test_consistent_hash(self):
+    def test_consistent_hash(self, extractor):
         """Same input should produce same hash."""
-        extractor = LLMSpecExtractor()
-
         hash1 = extractor._hash_input("Test input")
         hash2 = extractor._hash_input("Test input")
 
         assert hash1 == hash2
 
-    def test_different_input_different_hash(self):
+    def test_different_input_different_hash(self, extractor):
         """Different inputs should produce different hashes."""
-        extractor = LLMSpecExtractor()
-
         hash1 = extractor._hash_input("Input A")
         hash2 = extractor._hash_input("Input B")
 
@@ -158,18 +153,13 @@ class TestDeterminism:
 class TestOpenRouterIntegration:
     """Test OpenRouter integration (without actual API calls)."""
 
-    def test_openrouter_not_available_without_key(self):
+    def test_openrouter_not_available_without_key(self, monkeypatch):
         """OpenRouter should not be available without API key."""
-        # Clear any existing key
-        old_key = os.environ.pop("OPENROUTER_API_KEY", None)
-        try:
-            config = ExtractionConfig(openrouter_api_key=None)
-            extractor = LLMSpecExtractor(config)
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        config = ExtractionConfig(openrouter_api_key=None)
+        extractor = LLMSpecExtractor(config)
 
-            assert extractor._openrouter_available() is False
-        finally:
-            if old_key:
-                os.environ["OPENROUTER_API_KEY"] = old_key
+        assert extractor._openrouter_available() is False
 
     def test_openrouter_available_with_key(self):
         """OpenRouter should be available with API key (if httpx installed)."""
@@ -177,9 +167,7 @@ class TestOpenRouterIntegration:
         extractor = LLMSpecExtractor(config)
 
         # Will be True only if httpx is installed
-        from router.llm_extractor import HTTPX_AVAILABLE
-
-        assert extractor._openrouter_available() == HTTPX_AVAILABLE
+        assert extractor._openrouter_available() == httpx_available()
 
 
 class TestConvenienceFunctions:
@@ -193,49 +181,5 @@ class TestConvenienceFunctions:
         assert result.success
 
 
-def run_tests():
-    """Run all LLM extractor tests."""
-    import traceback
-
-    test_classes = [
-        TestLocalExtraction,
-        TestCaching,
-        TestModeSelection,
-        TestDeterminism,
-        TestOpenRouterIntegration,
-        TestConvenienceFunctions,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -8,11 +8,8 @@ Ensures:
 - Bitwise-stable output
 """
 
+import pytest
 import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from validator.normalizer import (
     normalize_dict_keys,
@@ -45,6 +42,15 @@ class TestKeyOrdering:
         result = normalize_dict_keys(obj)
         assert list(result[0].keys()) == ["a", "z"]
 
+    def test_deep_nesting_beyond_recursion_limit(self):
+        """Nesting deeper than the recursion limit should still normalize."""
+        obj = leaf = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf["z"], leaf["a"] = 0, {}
+            leaf = leaf["a"]
+        result = normalize_dict_keys(obj)
+        assert list(result.keys()) == ["a", "z"]
+
 
 class TestListOrdering:
     """Test stable list ordering."""
@@ -73,6 +79,19 @@ class TestListOrdering:
         assert result["reason_codes"] == ["CODE_A", "CODE_B"]
         assert result["required_fields"] == ["field_a", "field_z"]
 
+    def test_mixed_sortable_lists_preserved(self):
+        """Sortable keys holding non-string items keep their order."""
+        obj = {
+            "reasons": ["b", 1, "a"],
+            "reason_codes": [2, 1],
+            "blocking_gates": ["b", {"z": 1, "a": 2}],
+        }
+        result = normalize_list_ordering(obj)
+        assert result["reasons"] == ["b", 1, "a"]
+        assert result["reason_codes"] == [2, 1]
+        assert result["blocking_gates"] == ["b", {"z": 1, "a": 2}]
+        assert result["blocking_gates"][1] is not obj["blocking_gates"][1]
+
 
 class TestUnitConversion:
     """Test canonical unit conversion."""
@@ -119,6 +138,19 @@ class TestNormalization:
         assert "unit_canonical" in normalized["output"]
         assert normalized["output"]["unit_canonical"] == "kg"
 
+    def test_kernel_result_canonical_values_replace_stale_ones(self):
+        """Existing canonical/display keys on a quantity are overwritten, not duplicated."""
+        result = {"output": {"value": 10, "unit": "kg", "value_canonical": {"stale": True}}}
+        normalized = normalize_kernel_result(result)
+        assert normalized["output"] == {
+            "unit": "kg",
+            "unit_canonical": "kg",
+            "unit_display": "kg",
+            "value": 10,
+            "value_canonical": 10.0,
+            "value_display": 10,
+        }
+
     def test_complex_object_normalized(self):
         """Complex objects should be fully normalized."""
         obj = {
@@ -140,48 +172,16 @@ class TestNormalization:
         # Quantities canonicalized
         assert "unit_canonical" in normalized["nested"]["b"]
 
-
-def run_tests():
-    """Run all normalization tests."""
-    import traceback
-
-    test_classes = [
-        TestKeyOrdering,
-        TestListOrdering,
-        TestUnitConversion,
-        TestNormalization,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
+    def test_kernel_result_deep_nesting_beyond_recursion_limit(self):
+        """Full normalization should not depend on the recursion limit."""
+        obj = leaf = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf["reasons"], leaf["next"] = ["b", "a"], {"value": 1, "unit": "lb"}
+            leaf = leaf["next"]
+        normalized = normalize_kernel_result(obj)
+        assert normalized["reasons"] == ["a", "b"]
+        assert normalized["next"]["unit_canonical"] == "kg"
 
 
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
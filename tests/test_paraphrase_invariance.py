@@ -9,15 +9,14 @@ minimum answer variance."
 """
 
 import sys
-from pathlib import Path
+from typing import Optional
 
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+import pytest
 
-from models.task_spec import TaskRequest, Domain
-from models.gate_decision import Decision
+from models.task_spec import TaskRequest, TaskSpec, Domain
+from models.gate_decision import Decision, GateDecision
 from router.classifier import classify_task
-from validator.gates import run_gates, get_blocking_decisions
+from validator.gates import run_gates, first_blocking_decision
 
 
 # --- Paraphrase Sets ---
@@ -82,81 +81,94 @@ FLUIDS_PARAPHRASES = [
 ]
 
 
+# Requests are built once and shared by every test that classifies them
+def _requests(prefix: str, phrases: list[str]) -> list[TaskRequest]:
+    return [TaskRequest(request_id=f"{prefix}-{i}", user_input=p) for i, p in enumerate(phrases)]
+
+
+SPECIFIC_WEIGHT_REQUESTS = _requests("sw", SPECIFIC_WEIGHT_PARAPHRASES)
+LB_REQUESTS = _requests("lb", LB_PARAPHRASES)
+UNAMBIGUOUS_REQUESTS = _requests("clear", UNAMBIGUOUS_PARAPHRASES)
+FLUIDS_REQUESTS = _requests("fluids", FLUIDS_PARAPHRASES)
+
+
+def _phrase_id(task_request: TaskRequest) -> str:
+    return task_request.user_input
+
+
+def _evaluate(task_request: TaskRequest) -> tuple[TaskSpec, Optional[GateDecision]]:
+    """Route a request and run its gates; returns (spec, first blocking decision)."""
+    spec = classify_task(task_request)
+    return spec, first_blocking_decision(run_gates(spec, stop_on_block=True))
+
+
 class TestSpecificWeightParaphrase:
     """All phrasings of 'specific weight of water' should CLARIFY."""
 
-    def test_all_paraphrases_clarify(self):
+    @pytest.mark.parametrize("task_request", SPECIFIC_WEIGHT_REQUESTS, ids=_phrase_id)
+    def test_paraphrase_clarifies(self, task_request):
         """Every phrasing should trigger CLARIFY."""
-        for i, phrase in enumerate(SPECIFIC_WEIGHT_PARAPHRASES):
-            request = TaskRequest(request_id=f"sw-{i}", user_input=phrase)
-            spec = classify_task(request)
-            gate_results = run_gates(spec)
-            blocking = get_blocking_decisions(gate_results)
-
-            assert len(blocking) > 0, f"Phrase should CLARIFY: '{phrase}'"
-            assert blocking[0].decision in (
-                Decision.CLARIFY,
-                Decision.REJECT,
-            ), f"Phrase should block: '{phrase}'"
-
-    def test_all_route_to_physics(self):
+        phrase = task_request.user_input
+        _, first = _evaluate(task_request)
+
+        assert first is not None, f"Phrase should CLARIFY: '{phrase}'"
+        assert first.decision in (
+            Decision.CLARIFY,
+            Decision.REJECT,
+        ), f"Phrase should block: '{phrase}'"
+
+    @pytest.mark.parametrize("task_request", SPECIFIC_WEIGHT_REQUESTS, ids=_phrase_id)
+    def test_paraphrase_routes_to_physics(self, task_request):
         """All phrasings should route to physics domain."""
-        for i, phrase in enumerate(SPECIFIC_WEIGHT_PARAPHRASES):
-            request = TaskRequest(request_id=f"sw-route-{i}", user_input=phrase)
-            spec = classify_task(request)
+        spec = classify_task(task_request)
 
-            assert spec.domain == Domain.PHYSICS, f"Should route to physics: '{phrase}'"
+        assert spec.domain == Domain.PHYSICS, (
+            f"Should route to physics: '{task_request.user_input}'"
+        )
 
-    def test_all_include_ambiguity_gate(self):
+    @pytest.mark.parametrize("task_request", SPECIFIC_WEIGHT_REQUESTS, ids=_phrase_id)
+    def test_paraphrase_includes_ambiguity_gate(self, task_request):
         """All phrasings should require ambiguity gate."""
-        for i, phrase in enumerate(SPECIFIC_WEIGHT_PARAPHRASES):
-            request = TaskRequest(request_id=f"sw-gate-{i}", user_input=phrase)
-            spec = classify_task(request)
+        spec = classify_task(task_request)
 
-            assert "ambiguity_gate" in spec.required_gates, (
-                f"Should need ambiguity gate: '{phrase}'"
-            )
+        assert "ambiguity_gate" in spec.required_gates, (
+            f"Should need ambiguity gate: '{task_request.user_input}'"
+        )
 
 
 class TestLbParaphrase:
     """All phrasings with 'lb' should CLARIFY for unit ambiguity."""
 
-    def test_all_paraphrases_clarify(self):
+    @pytest.mark.parametrize("task_request", LB_REQUESTS, ids=_phrase_id)
+    def test_paraphrase_clarifies(self, task_request):
         """Every phrasing should trigger CLARIFY."""
-        for i, phrase in enumerate(LB_PARAPHRASES):
-            request = TaskRequest(request_id=f"lb-{i}", user_input=phrase)
-            spec = classify_task(request)
-            gate_results = run_gates(spec)
-            blocking = get_blocking_decisions(gate_results)
+        _, first = _evaluate(task_request)
 
-            assert len(blocking) > 0, f"Phrase should CLARIFY: '{phrase}'"
+        assert first is not None, f"Phrase should CLARIFY: '{task_request.user_input}'"
 
 
 class TestUnambiguousParaphrase:
     """Unambiguous requests should all ACCEPT."""
 
-    def test_all_paraphrases_accept(self):
+    @pytest.mark.parametrize("task_request", UNAMBIGUOUS_REQUESTS, ids=_phrase_id)
+    def test_paraphrase_accepts(self, task_request):
         """Every phrasing should pass gates."""
-        for i, phrase in enumerate(UNAMBIGUOUS_PARAPHRASES):
-            request = TaskRequest(request_id=f"clear-{i}", user_input=phrase)
-            spec = classify_task(request)
-            gate_results = run_gates(spec)
-            blocking = get_blocking_decisions(gate_results)
+        _, first = _evaluate(task_request)
 
-            assert len(blocking) == 0, f"Phrase should NOT block: '{phrase}' - got {blocking}"
+        assert first is None, f"Phrase should NOT block: '{task_request.user_input}' - got {first}"
 
 
 class TestFluidsParaphrase:
     """Fluids-related requests should all route to physics.fluids."""
 
-    def test_all_route_to_fluids(self):
+    @pytest.mark.parametrize("task_request", FLUIDS_REQUESTS, ids=_phrase_id)
+    def test_paraphrase_routes_to_fluids(self, task_request):
         """Every phrasing should route to fluids subdomain."""
-        for i, phrase in enumerate(FLUIDS_PARAPHRASES):
-            request = TaskRequest(request_id=f"fluids-{i}", user_input=phrase)
-            spec = classify_task(request)
+        phrase = task_request.user_input
+        spec = classify_task(task_request)
 
-            assert spec.domain == Domain.PHYSICS, f"Should route to physics: '{phrase}'"
-            assert spec.subdomain == "fluids", f"Should route to fluids: '{phrase}'"
+        assert spec.domain == Domain.PHYSICS, f"Should route to physics: '{phrase}'"
+        assert spec.subdomain == "fluids", f"Should route to fluids: '{phrase}'"
 
 
 class TestParaphraseConsistency:
@@ -164,63 +176,18 @@ class TestParaphraseConsistency:
 
     def test_specific_weight_specs_consistent(self):
         """All specific weight paraphrases should produce similar specs."""
-        specs = []
-        for i, phrase in enumerate(SPECIFIC_WEIGHT_PARAPHRASES[:5]):  # Sample 5
-            request = TaskRequest(request_id=f"consist-{i}", user_input=phrase)
-            spec = classify_task(request)
-            specs.append(spec)
+        specs = [classify_task(request) for request in SPECIFIC_WEIGHT_REQUESTS[:5]]  # Sample 5
 
         # All should have same domain
-        domains = [s.domain for s in specs]
-        assert len(set(domains)) == 1, f"Domains should be consistent: {domains}"
+        first_domain = specs[0].domain
+        assert all(s.domain == first_domain for s in specs[1:]), (
+            f"Domains should be consistent: {[s.domain for s in specs]}"
+        )
 
         # All should include ambiguity_gate (core requirement)
         for spec in specs:
             assert "ambiguity_gate" in spec.required_gates, "Should have ambiguity_gate"
 
 
-def run_tests():
-    """Run all paraphrase invariance tests."""
-    import traceback
-
-    test_classes = [
-        TestSpecificWeightParaphrase,
-        TestLbParaphrase,
-        TestUnambiguousParaphrase,
-        TestFluidsParaphrase,
-        TestParaphraseConsistency,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -2,9 +2,16 @@ import pytest
 from plugins import PluginRegistry
 
 
-def test_plugin_discovery():
+@pytest.fixture(scope="module")
+def discovered_registry():
+    """Registry after one discovery pass over plugins/; tests must not mutate it."""
     registry = PluginRegistry(plugins_dir="plugins")
     registry.discover_plugins()
+    return registry
+
+
+def test_plugin_discovery(discovered_registry):
+    registry = discovered_registry
 
     # Check if experiment domain was found
     assert "experiment" in registry.domains
@@ -7,11 +7,8 @@ Validates that:
 - Invalid data is properly rejected
 """
 
+import pytest
 import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from validator.schema_validator import (
     SchemaValidator,
@@ -22,49 +19,64 @@ from validator.schema_validator import (
 )
 
 
+@pytest.fixture(scope="module")
+def schema_validator():
+    return SchemaValidator()
+
+
+@pytest.fixture(scope="module")
+def registry_validator():
+    return RegistryValidator()
+
+
+@pytest.fixture(scope="module")
+def policy_validator():
+    return PolicyValidator()
+
+
 class TestSchemaValidator:
     """Test SchemaValidator class."""
 
-    def test_validates_valid_task_request(self):
-        validator = SchemaValidator()
+    def test_validates_valid_task_request(self, schema_validator):
         valid_request = {"user_input": "What is the specific weight of water?"}
-        is_valid, errors = validator.validate_task_request(valid_request)
+        is_valid, errors = schema_validator.validate_task_request(valid_request)
         assert is_valid, f"Should be valid: {errors}"
 
-    def test_rejects_invalid_task_request(self):
-        validator = SchemaValidator()
+    def test_rejects_invalid_task_request(self, schema_validator):
         invalid_request = {"user_input": ""}  # Empty string should fail minLength
-        is_valid, errors = validator.validate_task_request(invalid_request)
+        is_valid, errors = schema_validator.validate_task_request(invalid_request)
         # Note: depends on schema having minLength constraint
         # If no constraint, this may pass
 
-    def test_validates_valid_task_plan(self):
-        validator = SchemaValidator()
+    def test_validates_valid_task_plan(self, schema_validator):
         valid_plan = {"domain": "physics", "required_gates": ["schema_gate"]}
-        is_valid, errors = validator.validate_task_plan(valid_plan)
+        is_valid, errors = schema_validator.validate_task_plan(valid_plan)
         assert is_valid, f"Should be valid: {errors}"
 
-    def test_rejects_invalid_domain(self):
-        validator = SchemaValidator()
+    def test_rejects_invalid_domain(self, schema_validator):
         invalid_plan = {
             "domain": "invalid_domain",  # Not in enum
             "required_gates": [],
         }
-        is_valid, errors = validator.validate_task_plan(invalid_plan)
+        is_valid, errors = schema_validator.validate_task_plan(invalid_plan)
         assert not is_valid, "Should reject invalid domain"
 
+    def test_schema_parsed_once_per_id(self):
+        from validator.loader import load_schema
+
+        assert load_schema("task_plan") is load_schema("task_plan")
+        assert load_schema("no_such_schema") is None
+
 
 class TestRegistryValidator:
     """Test RegistryValidator class."""
 
-    def test_validates_kernel_registry(self):
-        validator = RegistryValidator()
-        is_valid, errors = validator.validate_kernel_registry()
+    def test_validates_kernel_registry(self, registry_validator):
+        is_valid, errors = registry_validator.validate_kernel_registry()
         assert is_valid, f"Kernel registry should be valid: {errors}"
 
-    def test_validates_quantities_registry(self):
-        validator = RegistryValidator()
-        is_valid, errors = validator.validate_quantities_registry()
+    def test_validates_quantities_registry(self, registry_validator):
+        is_valid, errors = registry_validator.validate_quantities_registry()
         assert is_valid, f"Quantities registry should be valid: {errors}"
 
     def test_validate_all_registries(self):
@@ -75,9 +87,8 @@ class TestRegistryValidator:
 class TestPolicyValidator:
     """Test PolicyValidator class."""
 
-    def test_validates_unit_disambiguation_policy(self):
-        validator = PolicyValidator()
-        is_valid, errors = validator.validate_policy("unit_disambiguation")
+    def test_validates_unit_disambiguation_policy(self, policy_validator):
+        is_valid, errors = policy_validator.validate_policy("unit_disambiguation")
         assert is_valid, f"unit_disambiguation policy should be valid: {errors}"
 
     def test_validates_all_policies(self):
@@ -87,46 +98,5 @@ class TestPolicyValidator:
         print(f"Policy validation: {is_valid}, errors: {errors}")
 
 
-def run_tests():
-    """Run all schema validation tests."""
-    import traceback
-
-    test_classes = [
-        TestSchemaValidator,
-        TestRegistryValidator,
-        TestPolicyValidator,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
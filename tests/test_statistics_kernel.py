@@ -4,22 +4,24 @@ Tests for Statistics Kernel.
 Verifies sample size calculation, t-tests, descriptive stats, and regression.
 """
 
+import pytest
 import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from models.kernel_io import KernelInput
 from kernels.statistics import StatisticsKernel
 
 
+@pytest.fixture(scope="module")
+def kernel():
+    # Kernels are stateless, so one instance serves every test
+    return StatisticsKernel()
+
+
 class TestSampleSize:
     """Test sample size calculation."""
 
-    def test_default_parameters(self):
+    def test_default_parameters(self, kernel):
         """Default parameters should return reasonable sample size."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -31,9 +33,8 @@ class TestSampleSize:
         assert result.result["n2"] > 0
         assert result.result["total_n"] > 0
 
-    def test_large_effect_size_smaller_n(self):
+    def test_large_effect_size_smaller_n(self, kernel):
         """Larger effect size should require smaller sample."""
-        kernel = StatisticsKernel()
         small_effect = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -52,9 +53,8 @@ class TestSampleSize:
 class TestTTest:
     """Test two-sample t-test."""
 
-    def test_identical_groups_not_significant(self):
+    def test_identical_groups_not_significant(self, kernel):
         """Identical groups should not be significant."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -69,9 +69,8 @@ class TestTTest:
         assert result.result["t_statistic"] == 0
         assert result.result["significant"] is False
 
-    def test_different_groups_significant(self):
+    def test_different_groups_significant(self, kernel):
         """Very different groups should be significant."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -86,9 +85,8 @@ class TestTTest:
         assert result.result["significant"] is True
         assert result.result["decision"] == "Reject H0"
 
-    def test_too_few_values_fails(self):
+    def test_too_few_values_fails(self, kernel):
         """Groups with less than 2 values should fail."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -105,9 +103,8 @@ class TestTTest:
 class TestDescriptive:
     """Test descriptive statistics."""
 
-    def test_basic_stats(self):
+    def test_basic_stats(self, kernel):
         """Should calculate basic descriptive statistics."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -121,9 +118,8 @@ class TestDescriptive:
         assert result.result["min"] == 1
         assert result.result["max"] == 5
 
-    def test_empty_data_fails(self):
+    def test_empty_data_fails(self, kernel):
         """Empty data should fail."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -136,9 +132,8 @@ class TestDescriptive:
 class TestRegression:
     """Test simple linear regression."""
 
-    def test_perfect_correlation(self):
+    def test_perfect_correlation(self, kernel):
         """Perfect linear data should have R²=1."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -154,9 +149,8 @@ class TestRegression:
         assert result.result["intercept"] == 0.0
         assert result.result["r_squared"] == 1.0
 
-    def test_mismatched_lengths_fails(self):
+    def test_mismatched_lengths_fails(self, kernel):
         """Different length arrays should fail."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -169,9 +163,8 @@ class TestRegression:
         result = kernel.execute(input)
         assert not result.success
 
-    def test_negative_correlation(self):
+    def test_negative_correlation(self, kernel):
         """Negative slope should work."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -190,9 +183,8 @@ class TestRegression:
 class TestValidation:
     """Test input validation."""
 
-    def test_unknown_operation_fails(self):
+    def test_unknown_operation_fails(self, kernel):
         """Unknown operation should fail gracefully."""
-        kernel = StatisticsKernel()
         input = KernelInput(
             request_id="test",
             kernel_id="statistics_v1",
@@ -203,48 +195,5 @@ class TestValidation:
         assert "Unknown operation" in result.error
 
 
-def run_tests():
-    """Run all statistics kernel tests."""
-    import traceback
-
-    test_classes = [
-        TestSampleSize,
-        TestTTest,
-        TestDescriptive,
-        TestRegression,
-        TestValidation,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_class.__name__}")
-        print("=" * 60)
-
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'=' * 60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    return failed == 0
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -5,13 +5,8 @@ Verifies workflow construction, step parsing, and dependency management.
 """
 
 import pytest
-import sys
-from pathlib import Path
 from datetime import datetime
 
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 from models.task_spec import TaskRequest
 from models.workflow import Workflow, WorkflowStep, WorkflowStatus
 from router.workflow_builder import build_workflow_from_request, WorkflowBuilder
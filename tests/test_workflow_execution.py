@@ -1,10 +1,6 @@
 import pytest
-import sys
-import os
 import asyncio
-
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import threading
 
 from models.workflow import Workflow, WorkflowStep, WorkflowStatus
 from models.session import Session
@@ -118,3 +114,109 @@ async def test_multi_step_independent():
     assert updated_wf.status == WorkflowStatus.COMPLETED
     assert updated_wf.steps[0].output["mean"] == 1.0
     assert updated_wf.steps[1].output["mean"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_kernel_instance_reused_across_steps():
+    """The orchestrator instantiates each kernel class once."""
+    orchestrator = Orchestrator()
+    session = Session(session_id="test_sess_4")
+
+    for i in range(2):
+        spec = TaskSpec(
+            request_id=f"reuse{i}",
+            user_input="Calculate mean",
+            domain="analysis",
+            selected_kernels=["statistics_v1"],
+            args={"data": [1, 2, 3], "operation": "descriptive"},
+        )
+        step = WorkflowStep(step_id=f"reuse_step{i}", description="mean", spec=spec)
+        await orchestrator.run_step(step, session)
+        assert step.status == WorkflowStatus.COMPLETED
+
+    assert list(orchestrator._kernel_instances) == ["statistics_v1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_step_traceback_only_at_debug(caplog):
+    """The formatted traceback is attached to step output only when DEBUG is enabled."""
+    orchestrator = Orchestrator()
+    session = Session(session_id="test_sess_5")
+
+    step = WorkflowStep(step_id="no_spec", description="missing spec")
+    await orchestrator.run_step(step, session)
+    assert step.status == WorkflowStatus.FAILED
+    assert "no TaskSpec" in step.output["error"]
+    assert "traceback" not in step.output
+
+    caplog.set_level("DEBUG", logger="orchestrator")
+    step = WorkflowStep(step_id="no_spec_debug", description="missing spec")
+    await orchestrator.run_step(step, session)
+    assert "ValueError" in step.output["traceback"]
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently(monkeypatch):
+    """Steps in the same wave execute at the same time, not one after another."""
+    orchestrator = Orchestrator()
+    session = Session(session_id="test_sess_6")
+    kernel = orchestrator._get_kernel_instance("statistics_v1")
+    barrier = threading.Barrier(2, timeout=5)
+    execute = kernel.execute
+
+    def rendezvous(kernel_input):
+        # Raises BrokenBarrierError unless both steps are in flight together
+        barrier.wait()
+        return execute(kernel_input)
+
+    monkeypatch.setattr(kernel, "execute", rendezvous)
+
+    steps = [
+        WorkflowStep(
+            step_id=f"wave_step{i}",
+            description="mean",
+            spec=TaskSpec(
+                request_id=f"wave{i}",
+                user_input="Calculate mean",
+                domain="analysis",
+                selected_kernels=["statistics_v1"],
+                args={"data": [i, i, i], "operation": "descriptive"},
+            ),
+        )
+        for i in range(2)
+    ]
+    workflow = Workflow(workflow_id="wf_wave", name="Wave", steps=steps)
+
+    updated_wf = await orchestrator.run_workflow(workflow, session)
+
+    assert updated_wf.status == WorkflowStatus.COMPLETED
+    assert [s.output["mean"] for s in updated_wf.steps] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_run_many_runs_workflows_in_order():
+    """run_many returns each workflow's result in the order given."""
+    orchestrator = Orchestrator()
+    runs = []
+    for i in range(3):
+        spec = TaskSpec(
+            request_id=f"many{i}",
+            user_input="Calculate mean",
+            domain="analysis",
+            selected_kernels=["statistics_v1"],
+            args={"data": [i, i, i], "operation": "descriptive"},
+        )
+        step = WorkflowStep(step_id=f"many_step{i}", description="mean", spec=spec)
+        workflow = Workflow(workflow_id=f"wf_many{i}", name="Many", steps=[step])
+        runs.append((workflow, Session(session_id=f"test_sess_many{i}")))
+
+    results = await orchestrator.run_many(runs)
+
+    assert [wf.workflow_id for wf in results] == ["wf_many0", "wf_many1", "wf_many2"]
+    assert all(wf.status == WorkflowStatus.COMPLETED for wf in results)
+    assert [wf.steps[0].output["mean"] for wf in results] == [0, 1, 2]
+    assert [session.active_workflow_id for _, session in runs] == [
+        "wf_many0",
+        "wf_many1",
+        "wf_many2",
+    ]
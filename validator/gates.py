@@ -7,12 +7,157 @@ Soft gates: Attach warnings (ambiguity detection)
 All gates accept TaskSpec and return GateDecision.
 """
 
+import functools
 import re
-from typing import Any
+from typing import Any, Optional
 
 from models.task_spec import TaskSpec
 from models.gate_decision import GateDecision, Decision
 from .loader import load_quantities, load_policy
+from .term_scanner import term_scanner
+
+
+# --- Precompiled Patterns ---
+
+
+def _keyword_re(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into one case-insensitive alternation (substring semantics)."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _word_re(word: str) -> re.Pattern:
+    """Case-insensitive whole-word pattern, compiled once per word."""
+    return re.compile(rf"\b{word}\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _lowered(text: str) -> str:
+    """text.lower(), shared by the gates that run on the same input."""
+    return text.lower()
+
+
+# Bounded window between "sample size" and its number keeps the scan linear
+# (an unbounded .*? rescans the rest of the line for every occurrence), and
+# at most 9 digits keeps int() cheap and within its digit limit.
+_SAMPLE_SIZE_RE = re.compile(r"sample[ \t]+size[^\d\n]{0,64}(\d{1,9})(?!\d)", re.IGNORECASE)
+_HUMAN_SUBJECTS_RE = _keyword_re(
+    ("human", "patient", "participant", "subject", "interview", "survey")
+)
+_IRB_RE = _keyword_re(("irb",))
+_WRITE_RE = _keyword_re(("save", "write", "export", "dump", "log to"))
+_SECRET_RE = _keyword_re(("secret", "key"))
+
+
+# --- Cached Policy Tables ---
+
+
+@functools.lru_cache(maxsize=1)
+def _ambiguity_checks() -> tuple[tuple[str, str, str, str], ...]:
+    """
+    Flattened ambiguity checks in report order, as (lowercased term, reason,
+    required field, question): every disallowed term, then every alias of a
+    quantity that collides with another.
+    """
+    policy = load_policy("unit_disambiguation") or {}
+    checks = [
+        (
+            term.lower(),
+            "DISALLOWED_TERM",
+            f"{term.replace(' ', '_').lower()}_clarification",
+            f"The term '{term}' is ambiguous. Please clarify what you mean.",
+        )
+        for term in policy.get("disallowed_without_disambiguator", [])
+    ]
+    for qty in load_quantities().get("quantities", []):
+        if not qty.get("collides_with"):
+            continue
+        hint = qty.get("disambiguation_hint", "")
+        checks.extend(
+            (
+                alias.lower(),
+                "TERM_COLLISION",
+                f"{alias.replace(' ', '_').lower()}_disambiguation",
+                f"'{alias}' could mean multiple things. {hint} Please specify which you mean.",
+            )
+            for alias in qty.get("aliases", [])
+        )
+    return tuple(checks)
+
+
+@functools.lru_cache(maxsize=1)
+def _ambiguity_terms() -> tuple[str, ...]:
+    """Lowercased terms of _ambiguity_checks(), for the single-pass scan."""
+    return tuple(term for term, _, _, _ in _ambiguity_checks())
+
+
+@functools.lru_cache(maxsize=1)
+def _clarify_units() -> tuple[Optional[re.Pattern], tuple[tuple[str, dict], ...]]:
+    """
+    Ambiguous units whose policy action is CLARIFY, plus one combined
+    whole-word pattern that matches if any of them occurs.
+    """
+    policy = load_policy("unit_disambiguation") or {}
+    units = tuple(
+        (unit, config)
+        for unit, config in policy.get("ambiguous_units", {}).items()
+        if config.get("action") == "CLARIFY"
+    )
+    if not units:
+        return None, units
+    any_unit_re = re.compile("|".join(rf"(?:\b{unit}\b)" for unit, _ in units), re.IGNORECASE)
+    return any_unit_re, units
+
+
+_PLAIN_WORD_RE = re.compile(r"[A-Za-z0-9_]+(?: [A-Za-z0-9_]+)*")
+
+
+@functools.lru_cache(maxsize=1)
+def _plain_clarify_units() -> Optional[tuple[str, ...]]:
+    """
+    Lowercased CLARIFY units for the str.find fast path, or None if any of
+    them is not a plain ASCII word (those need the regex path).
+    """
+    _, units = _clarify_units()
+    if not all(_PLAIN_WORD_RE.fullmatch(unit) for unit, _ in units):
+        return None
+    return tuple(unit.lower() for unit, _ in units)
+
+
+def _contains_word(text: str, word: str) -> bool:
+    """str.find equivalent of re.search(rf"\b{word}\b", text) for ASCII text and word."""
+    start = 0
+    while (i := text.find(word, start)) != -1:
+        j = i + len(word)
+        before = text[i - 1] if i else " "
+        after = text[j] if j < len(text) else " "
+        if not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_"):
+            return True
+        start = i + 1
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _denied_fragments() -> tuple[tuple[str, str], ...]:
+    """
+    (pattern, literal) pairs for the file-write denied globs. Text is matched
+    against the glob with its wildcards stripped (glob matching would be
+    ideal but does not apply to free text).
+    """
+    policy = load_policy("file_write_policy") or {}
+    pairs = ((pattern, pattern.replace("*", "")) for pattern in policy.get("denied_patterns", []))
+    return tuple((pattern, fragment) for pattern, fragment in pairs if fragment)
+
+
+def reset_gate_caches() -> None:
+    """Drop cached policies, registries and derived tables (e.g. after editing them)."""
+    load_policy.cache_clear()
+    load_quantities.cache_clear()
+    _ambiguity_checks.cache_clear()
+    _ambiguity_terms.cache_clear()
+    _clarify_units.cache_clear()
+    _plain_clarify_units.cache_clear()
+    _denied_fragments.cache_clear()
 
 
 # --- Gate Implementations ---
@@ -46,22 +191,37 @@ def unit_consistency_gate(spec: TaskSpec) -> GateDecision:
 
     This is a soft gate - may CLARIFY but not REJECT.
     """
-    # Load unit disambiguation policy
-    policy = load_policy("unit_disambiguation") or {}
-    ambiguous_units = policy.get("ambiguous_units", {})
+    any_unit_re, clarify_units = _clarify_units()
+    plain_units = _plain_clarify_units()
+    user_input = spec.user_input
+
+    # ASCII input against plain ASCII units: lowercase once and use str.find
+    # with explicit word-boundary checks. Otherwise one combined IGNORECASE
+    # scan rules out the common case, and only on a hit are the units
+    # matched individually. Either way matches are reported in policy order.
+    if plain_units is not None and user_input.isascii():
+        user_input_lower = _lowered(user_input)
+        matched = [
+            unit_config
+            for unit_config, word in zip(clarify_units, plain_units)
+            if _contains_word(user_input_lower, word)
+        ]
+    elif any_unit_re is not None and any_unit_re.search(user_input):
+        matched = [
+            (unit, config) for unit, config in clarify_units if _word_re(unit).search(user_input)
+        ]
+    else:
+        matched = []
 
     reasons = []
     required_fields = []
     questions = []
 
-    # Check for ambiguous unit strings in original input
-    for unit, config in ambiguous_units.items():
-        if re.search(rf"\b{unit}\b", spec.user_input, re.IGNORECASE):
-            if config.get("action") == "CLARIFY":
-                reasons.append("UNIT_AMBIGUOUS")
-                required_fields.append("unit_clarification")
-                question = config.get("question", f"Please clarify the unit '{unit}'")
-                questions.append(question)
+    for unit, config in matched:
+        reasons.append("UNIT_AMBIGUOUS")
+        required_fields.append("unit_clarification")
+        question = config.get("question", f"Please clarify the unit '{unit}'")
+        questions.append(question)
 
     if reasons:
         return GateDecision(
@@ -81,49 +241,29 @@ def ambiguity_gate(spec: TaskSpec) -> GateDecision:
 
     This is the main ambiguity detection gate.
     """
-    user_input_lower = spec.user_input.lower()
-
-    # Load quantities registry
-    quantities = load_quantities()
-    quantities_list = quantities.get("quantities", [])
+    user_input_lower = _lowered(spec.user_input)
 
-    # Load unit disambiguation policy
-    policy = load_policy("unit_disambiguation") or {}
-    disallowed = policy.get("disallowed_without_disambiguator", [])
-
-    reasons = []
-    required_fields = []
+    # Reasons and fields are ordered sets (dicts), deduped as they are added
+    reasons: dict[str, None] = {}
+    required_fields: dict[str, None] = {}
     questions = []
 
-    # Check for disallowed terms
-    for term in disallowed:
-        if term.lower() in user_input_lower:
-            reasons.append("DISALLOWED_TERM")
-            field_name = term.replace(" ", "_").lower()
-            required_fields.append(f"{field_name}_clarification")
-            questions.append(f"The term '{term}' is ambiguous. Please clarify what you mean.")
-
-    # Check for term collisions
-    for qty in quantities_list:
-        for alias in qty.get("aliases", []):
-            if alias.lower() in user_input_lower:
-                collides_with = qty.get("collides_with", [])
-                if collides_with:
-                    reasons.append("TERM_COLLISION")
-                    field_name = alias.replace(" ", "_").lower()
-                    required_fields.append(f"{field_name}_disambiguation")
-                    hint = qty.get("disambiguation_hint", "")
-                    questions.append(
-                        f"'{alias}' could mean multiple things. {hint} "
-                        f"Please specify which you mean."
-                    )
+    # Scan once for every disallowed term and colliding alias, then report
+    # in policy/registry order
+    hits = term_scanner(_ambiguity_terms()).find(user_input_lower)
+
+    for term, reason, field_name, question in _ambiguity_checks():
+        if term in hits:
+            reasons[reason] = None
+            required_fields[field_name] = None
+            questions.append(question)
 
     if reasons:
         return GateDecision(
             gate_id="ambiguity_gate",
             decision=Decision.CLARIFY,
-            reasons=list(set(reasons)),  # dedupe
-            required_fields=list(set(required_fields)),
+            reasons=list(reasons),
+            required_fields=list(required_fields),
             clarifying_questions=questions,
         )
 
@@ -166,7 +306,7 @@ def experiment_safety_gate(spec: TaskSpec) -> GateDecision:
 
     # Search for sample size in user_input if not in args
     # Naive extraction for safety check if not already extracted
-    n_match = re.search(r"sample size.*?(\d+)", spec.user_input, re.IGNORECASE)
+    n_match = _SAMPLE_SIZE_RE.search(spec.user_input)
     if n_match:
         n = int(n_match.group(1))
         if n < min_n:
@@ -174,13 +314,12 @@ def experiment_safety_gate(spec: TaskSpec) -> GateDecision:
             decision = Decision.WARN
 
     # Check for human subjects keywords
-    hs_keywords = ["human", "patient", "participant", "subject", "interview", "survey"]
-    is_human_subjects = any(k in spec.user_input.lower() for k in hs_keywords)
+    is_human_subjects = _HUMAN_SUBJECTS_RE.search(spec.user_input) is not None
 
     if is_human_subjects:
         if human_subjects.get("irb_approval_required"):
             # Check if IRB mentioned
-            if "irb" not in spec.user_input.lower():
+            if not _IRB_RE.search(spec.user_input):
                 reasons.append("IRB_APPROVAL_REQUIRED")
                 required_fields.append("irb_protocol_number")
                 questions.append(
@@ -206,23 +345,21 @@ def file_write_gate(spec: TaskSpec) -> GateDecision:
 
     Enforces restricted directories and file types.
     """
-    policy = load_policy("file_write_policy") or {}
-    denied_patterns = policy.get("denied_patterns", [])
-
     # If operation involves writing (checking keywords for now)
-    write_keywords = ["save", "write", "export", "dump", "log to"]
-    if not any(k in spec.user_input.lower() for k in write_keywords):
+    if not _WRITE_RE.search(spec.user_input):
         return GateDecision(gate_id="file_write_gate", decision=Decision.ACCEPT, reasons=[])
 
-    # Check for restricted patterns in input
-    reasons = []
-    for pattern in denied_patterns:
-        # Simple string check for now (glob matching would be ideal but complex on text)
-        clean_pat = pattern.replace("*", "")
-        if clean_pat and clean_pat in spec.user_input:
-            reasons.append(f"Potential restricted file pattern: {pattern}")
-
-    if "secret" in spec.user_input.lower() or "key" in spec.user_input.lower():
+    # Check for restricted patterns in input: one scan for every fragment,
+    # then report in policy order
+    denied = _denied_fragments()
+    hits = term_scanner(tuple(fragment for _, fragment in denied)).find(spec.user_input)
+    reasons = [
+        f"Potential restricted file pattern: {pattern}"
+        for pattern, fragment in denied
+        if fragment in hits
+    ]
+
+    if _SECRET_RE.search(spec.user_input):
         reasons.append("Potential secret exposure")
 
     if reasons:
@@ -249,10 +386,13 @@ GATES = {
 }
 
 
-def run_gates(spec: TaskSpec) -> list[GateDecision]:
+def run_gates(spec: TaskSpec, stop_on_block: bool = False) -> list[GateDecision]:
     """
     Run all required gates for a TaskSpec.
 
+    With stop_on_block, the remaining gates are skipped once one blocks;
+    use it when only the first blocking decision matters.
+
     Returns list of GateDecision models.
     """
     results = []
@@ -261,6 +401,8 @@ def run_gates(spec: TaskSpec) -> list[GateDecision]:
         if gate_fn:
             decision = gate_fn(spec)
             results.append(decision)
+            if stop_on_block and decision.is_blocking():
+                break
 
     return results
 
@@ -268,3 +410,8 @@ def run_gates(spec: TaskSpec) -> list[GateDecision]:
 def get_blocking_decisions(decisions: list[GateDecision]) -> list[GateDecision]:
     """Return only the decisions that block execution."""
     return [d for d in decisions if d.is_blocking()]
+
+
+def first_blocking_decision(decisions: list[GateDecision]) -> Optional[GateDecision]:
+    """Return the first decision that blocks execution, or None if none do."""
+    return next((d for d in decisions if d.is_blocking()), None)
@@ -7,6 +7,8 @@ Validates that all references in the registry resolve to real implementations:
 - Policy references → existing policy files
 """
 
+import functools
+import importlib
 import sys
 from pathlib import Path
 from typing import Optional
@@ -35,6 +37,18 @@ KERNEL_IMPLEMENTATIONS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def resolve_kernel_class(module_path: str, class_name: str) -> Optional[type]:
+    """
+    Import module_path and return its class_name attribute (None if absent).
+
+    Memoized so every validator and test resolves each implementation once.
+    ImportError propagates and is not cached.
+    """
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name, None)
+
+
 def validate_kernel_references() -> tuple[bool, list[str]]:
     """
     Validate that all kernel_ids in registry have implementations or are planned.
@@ -65,10 +79,7 @@ def validate_kernel_references() -> tuple[bool, list[str]]:
         # Try to import the kernel class
         module_path, class_name = impl
         try:
-            import importlib
-
-            module = importlib.import_module(module_path)
-            kernel_class = getattr(module, class_name, None)
+            kernel_class = resolve_kernel_class(module_path, class_name)
             if kernel_class is None:
                 errors.append(f"Kernel {kernel_id}: class {class_name} not found in {module_path}")
         except ImportError as e:
@@ -167,10 +178,9 @@ def validate_registry_kernel_interface() -> tuple[bool, list[str]]:
 
         module_path, class_name = impl
         try:
-            import importlib
-
-            module = importlib.import_module(module_path)
-            kernel_class = getattr(module, class_name)
+            kernel_class = resolve_kernel_class(module_path, class_name)
+            if kernel_class is None:
+                raise AttributeError(f"class {class_name} not found in {module_path}")
 
             # Check required class attributes
             if not hasattr(kernel_class, "kernel_id"):
@@ -2,6 +2,7 @@
 Loader: Load registry, schemas, and policies from disk.
 """
 
+import functools
 import json
 import yaml
 from pathlib import Path
@@ -13,9 +14,18 @@ REGISTRY_DIR = PROJECT_ROOT / "registry"
 SCHEMAS_DIR = PROJECT_ROOT / "schemas"
 POLICIES_DIR = PROJECT_ROOT / "policies"
 
+# libyaml's C loader when PyYAML was built with it; same results as safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+@functools.lru_cache(maxsize=1)
 def load_registry() -> dict:
-    """Load the kernel registry."""
+    """
+    Load the kernel registry.
+
+    Parsed once per process and shared by all callers, so treat the result
+    as read-only; call load_registry.cache_clear() after editing the file.
+    """
     registry_path = REGISTRY_DIR / "kernels.json"
     if registry_path.exists():
         with open(registry_path) as f:
@@ -23,8 +33,13 @@ def load_registry() -> dict:
     return {"kernels": []}
 
 
+@functools.lru_cache(maxsize=1)
 def load_quantities() -> dict:
-    """Load the quantities registry."""
+    """
+    Load the quantities registry.
+
+    Cached like load_registry(); treat the result as read-only.
+    """
     path = REGISTRY_DIR / "quantities.json"
     if path.exists():
         with open(path) as f:
@@ -32,8 +47,13 @@ def load_quantities() -> dict:
     return {"quantities": []}
 
 
+@functools.lru_cache(maxsize=1)
 def load_reason_codes() -> dict:
-    """Load reason codes registry."""
+    """
+    Load reason codes registry.
+
+    Cached like load_registry(); treat the result as read-only.
+    """
     path = REGISTRY_DIR / "reason_codes.json"
     if path.exists():
         with open(path) as f:
@@ -41,6 +61,7 @@ def load_reason_codes() -> dict:
     return {"reason_codes": {}}
 
 
+@functools.lru_cache(maxsize=128)
 def load_schema(schema_id: str) -> Optional[dict]:
     """
     Load a schema by ID.
@@ -48,6 +69,8 @@ def load_schema(schema_id: str) -> Optional[dict]:
     schema_id can be:
     - Full filename: "problem_spec.schema.json"
     - Basename: "problem_spec"
+
+    Parsed once per ID and shared by all callers; treat the result as read-only.
     """
     # Normalize schema_id
     if not schema_id.endswith(".schema.json"):
@@ -60,6 +83,7 @@ def load_schema(schema_id: str) -> Optional[dict]:
     return None
 
 
+@functools.lru_cache(maxsize=128)
 def load_policy(policy_id: str) -> Optional[dict]:
     """
     Load a policy by ID.
@@ -67,6 +91,8 @@ def load_policy(policy_id: str) -> Optional[dict]:
     policy_id can be:
     - Full filename: "determinism.yaml"
     - Basename: "determinism"
+
+    Parsed once per ID and shared by all callers; treat the result as read-only.
     """
     # Normalize policy_id
     if not policy_id.endswith(".yaml"):
@@ -75,7 +101,7 @@ def load_policy(policy_id: str) -> Optional[dict]:
     policy_path = POLICIES_DIR / policy_id
     if policy_path.exists():
         with open(policy_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_LOADER)
     return None
 
 
@@ -95,5 +121,5 @@ def load_all_policies() -> dict[str, dict]:
     policies = {}
     for policy_file in POLICIES_DIR.glob("*.yaml"):
         with open(policy_file) as f:
-            policies[policy_file.stem] = yaml.safe_load(f)
+            policies[policy_file.stem] = yaml.load(f, Loader=_YAML_LOADER)
     return policies
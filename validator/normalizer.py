@@ -10,7 +10,9 @@ This enables "bitwise-stable" outputs: same inputs → identical JSON.
 """
 
 import json
-from typing import Any
+from itertools import chain
+from operator import itemgetter
+from typing import AbstractSet, Any, Iterable
 from decimal import Decimal
 
 # Canonical SI units for each quantity type
@@ -69,9 +71,97 @@ CONVERSION_TO_SI = {
 }
 
 
+# Flattened lookup: unit -> (multiplier, canonical unit), built from the tables above
+_TO_CANONICAL = {
+    unit: (multiplier, CANONICAL_UNITS[quantity_type])
+    for unit, (quantity_type, multiplier) in CONVERSION_TO_SI.items()
+}
+
+# Dict keys whose list values are unordered sets of strings
+SORTABLE_LIST_KEYS = frozenset({"required_fields", "reasons", "reason_codes", "blocking_gates"})
+
+
+# Keys _canonical_items adds to a quantity
+_CANONICAL_KEYS = frozenset({"value_canonical", "unit_canonical", "value_display", "unit_display"})
+
+
+def _canonical_items(obj: dict) -> Iterable[tuple[str, Any]]:
+    """obj's items plus canonical/display value and unit if it is a quantity."""
+    if "value" in obj and "unit" in obj:
+        value = obj["value"]
+        unit = obj["unit"]
+        if isinstance(value, (int, float)) and isinstance(unit, str):
+            can_value, can_unit = convert_to_canonical(value, unit)
+            extras = (
+                ("value_canonical", can_value),
+                ("unit_canonical", can_unit),
+                # Keep original as display values
+                ("value_display", value),
+                ("unit_display", unit),
+            )
+            if _CANONICAL_KEYS.isdisjoint(obj):
+                return chain(obj.items(), extras)
+            # Added keys replace existing ones, so merge rather than repeat them
+            return {**obj, **dict(extras)}.items()
+    return obj.items()
+
+
+def _walk(
+    obj: Any,
+    sort_keys: bool = False,
+    sortable_keys: AbstractSet[str] = frozenset(),
+    quantities: bool = False,
+) -> Any:
+    """
+    Copy a JSON-like tree in one iterative pass (no recursion limit).
+
+    Optionally sorts dict keys, sorts all-string lists stored under
+    sortable_keys, and annotates quantities (see normalize_quantities). Each
+    container is copied into its parent's slot, with nested containers
+    queued behind a placeholder.
+    """
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    root = [None]
+    stack = [(obj, root, 0)]
+    while stack:
+        src, parent, slot = stack.pop()
+        if isinstance(src, dict):
+            out = {}
+            items = _canonical_items(src) if quantities else src.items()
+            if sort_keys:
+                items = sorted(items, key=itemgetter(0))
+            in_dict = True
+        else:
+            out = [None] * len(src)
+            items = enumerate(src)
+            in_dict = False
+        parent[slot] = out
+        for k, v in items:
+            if not isinstance(v, (dict, list)):
+                out[k] = v
+                continue
+            if (
+                in_dict
+                and k in sortable_keys
+                and isinstance(v, list)
+                and (not v or isinstance(v[0], str))
+            ):
+                # str only orders against str, so sorted() raises on a mixed list
+                try:
+                    out[k] = sorted(v)
+                    continue
+                except TypeError:
+                    pass
+            out[k] = None
+            stack.append((v, out, k))
+    return root[0]
+
+
 def normalize_dict_keys(obj: Any) -> Any:
     """
-    Recursively sort dictionary keys for stable serialization.
+    Sort dictionary keys at every nesting level for stable serialization.
 
     Args:
         obj: Any Python object
@@ -79,44 +169,25 @@ def normalize_dict_keys(obj: Any) -> Any:
     Returns:
         The same object with all dicts having sorted keys
     """
-    if isinstance(obj, dict):
-        return {k: normalize_dict_keys(v) for k, v in sorted(obj.items())}
-    elif isinstance(obj, list):
-        return [normalize_dict_keys(item) for item in obj]
-    else:
-        return obj
+    return _walk(obj, sort_keys=True)
 
 
-def normalize_list_ordering(obj: Any, sortable_keys: set[str] = None) -> Any:
+def normalize_list_ordering(obj: Any, sortable_keys: AbstractSet[str] = SORTABLE_LIST_KEYS) -> Any:
     """
     Sort lists where order is not semantically meaningful.
 
     Args:
         obj: Any Python object
         sortable_keys: Set of dict keys whose list values should be sorted
+            (defaults to SORTABLE_LIST_KEYS)
 
     Returns:
         Object with specified lists sorted
     """
     if sortable_keys is None:
-        sortable_keys = {"required_fields", "reasons", "reason_codes", "blocking_gates"}
-
-    if isinstance(obj, dict):
-        result = {}
-        for k, v in obj.items():
-            if k in sortable_keys and isinstance(v, list):
-                # Sort if all items are strings
-                if all(isinstance(x, str) for x in v):
-                    result[k] = sorted(v)
-                else:
-                    result[k] = [normalize_list_ordering(x, sortable_keys) for x in v]
-            else:
-                result[k] = normalize_list_ordering(v, sortable_keys)
-        return result
-    elif isinstance(obj, list):
-        return [normalize_list_ordering(item, sortable_keys) for item in obj]
-    else:
-        return obj
+        sortable_keys = SORTABLE_LIST_KEYS
+
+    return _walk(obj, sortable_keys=sortable_keys)
 
 
 def convert_to_canonical(value: float, from_unit: str) -> tuple[float, str]:
@@ -130,15 +201,13 @@ def convert_to_canonical(value: float, from_unit: str) -> tuple[float, str]:
     Returns:
         (canonical_value, canonical_unit)
     """
-    if from_unit not in CONVERSION_TO_SI:
+    conversion = _TO_CANONICAL.get(from_unit)
+    if conversion is None:
         # Unknown unit, return as-is
         return (value, from_unit)
 
-    quantity_type, multiplier = CONVERSION_TO_SI[from_unit]
-    canonical_unit = CANONICAL_UNITS[quantity_type]
-    canonical_value = value * multiplier
-
-    return (canonical_value, canonical_unit)
+    multiplier, canonical_unit = conversion
+    return (value * multiplier, canonical_unit)
 
 
 def normalize_quantities(obj: Any) -> Any:
@@ -153,26 +222,7 @@ def normalize_quantities(obj: Any) -> Any:
     Returns:
         Object with quantities normalized to SI
     """
-    if isinstance(obj, dict):
-        # Check if this is a quantity (has value + unit)
-        if "value" in obj and "unit" in obj:
-            value = obj["value"]
-            unit = obj["unit"]
-            if isinstance(value, (int, float)) and isinstance(unit, str):
-                can_value, can_unit = convert_to_canonical(value, unit)
-                result = obj.copy()
-                result["value_canonical"] = can_value
-                result["unit_canonical"] = can_unit
-                # Keep original as display values
-                result["value_display"] = value
-                result["unit_display"] = unit
-                return {k: normalize_quantities(v) for k, v in sorted(result.items())}
-
-        return {k: normalize_quantities(v) for k, v in sorted(obj.items())}
-    elif isinstance(obj, list):
-        return [normalize_quantities(item) for item in obj]
-    else:
-        return obj
+    return _walk(obj, sort_keys=True, quantities=True)
 
 
 def normalize_for_logging(obj: Any) -> str:
@@ -187,9 +237,9 @@ def normalize_for_logging(obj: Any) -> str:
     Returns:
         Deterministic JSON string
     """
-    normalized = normalize_dict_keys(obj)
-    normalized = normalize_list_ordering(normalized)
-    return json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    normalized = _walk(obj, sort_keys=True, sortable_keys=SORTABLE_LIST_KEYS)
+    # Dicts are already key-sorted, so the encoder need not sort them again
+    return json.dumps(normalized, separators=(",", ":"))
 
 
 def normalize_for_response(obj: Any) -> dict:
@@ -204,9 +254,7 @@ def normalize_for_response(obj: Any) -> dict:
     Returns:
         Normalized dict
     """
-    normalized = normalize_dict_keys(obj)
-    normalized = normalize_list_ordering(normalized)
-    return normalized
+    return _walk(obj, sort_keys=True, sortable_keys=SORTABLE_LIST_KEYS)
 
 
 def normalize_kernel_result(result: dict) -> dict:
@@ -221,10 +269,7 @@ def normalize_kernel_result(result: dict) -> dict:
     Returns:
         Fully normalized result
     """
-    normalized = normalize_dict_keys(result)
-    normalized = normalize_list_ordering(normalized)
-    normalized = normalize_quantities(normalized)
-    return normalized
+    return _walk(result, sort_keys=True, sortable_keys=SORTABLE_LIST_KEYS, quantities=True)
 
 
 if __name__ == "__main__":
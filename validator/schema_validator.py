@@ -7,41 +7,60 @@ Validates that:
 - Policies conform to policy schemas
 """
 
+import functools
 import json
 from pathlib import Path
-from typing import Optional
-from jsonschema import validate, ValidationError, Draft202012Validator
+from typing import Any, Optional
+from jsonschema import ValidationError, Draft202012Validator
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+import yaml
+
+from .loader import (
+    PROJECT_ROOT,
+    SCHEMAS_DIR,
+    REGISTRY_DIR,
+    POLICIES_DIR,
+    _YAML_LOADER,
+    load_quantities,
+    load_registry,
+    load_schema,
+)
+
+
+def _compile_schema(schema: dict) -> Validator:
+    """
+    Build the validator jsonschema.validate() would use for schema, checking
+    the schema against its meta-schema once instead of on every call.
+    """
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
 
-from .loader import PROJECT_ROOT, SCHEMAS_DIR, REGISTRY_DIR, POLICIES_DIR
+
+@functools.lru_cache(maxsize=128)
+def _schema_validator(schema_id: str) -> Optional[Validator]:
+    """Compiled validator for a schema file (None if it doesn't exist)."""
+    schema = load_schema(schema_id)
+    if not schema:
+        return None
+    return _compile_schema(schema)
+
+
+def _first_error(validator: Validator, instance: Any) -> Optional[ValidationError]:
+    """The error jsonschema.validate() would raise for instance, or None."""
+    return best_match(validator.iter_errors(instance))
 
 
 class SchemaValidator:
     """
     Validates data against JSON Schema definitions.
 
-    Caches loaded schemas for performance.
+    Schemas are loaded and compiled once per process and shared by all
+    instances.
     """
 
-    def __init__(self):
-        self._schema_cache: dict[str, dict] = {}
-
-    def _load_schema(self, schema_id: str) -> Optional[dict]:
-        """Load and cache a schema by ID."""
-        if schema_id in self._schema_cache:
-            return self._schema_cache[schema_id]
-
-        # Normalize schema_id
-        if not schema_id.endswith(".schema.json"):
-            schema_id = f"{schema_id}.schema.json"
-
-        schema_path = SCHEMAS_DIR / schema_id
-        if schema_path.exists():
-            with open(schema_path) as f:
-                schema = json.load(f)
-                self._schema_cache[schema_id] = schema
-                return schema
-        return None
-
     def validate_against_schema(self, data: dict, schema_id: str) -> tuple[bool, list[str]]:
         """
         Validate data against a schema.
@@ -49,16 +68,14 @@ class SchemaValidator:
         Returns:
             (is_valid, error_messages)
         """
-        schema = self._load_schema(schema_id)
-        if not schema:
+        validator = _schema_validator(schema_id)
+        if validator is None:
             return (False, [f"Schema not found: {schema_id}"])
 
-        try:
-            validate(instance=data, schema=schema)
-            return (True, [])
-        except ValidationError as e:
-            errors = [f"{e.json_path}: {e.message}"]
-            return (False, errors)
+        error = _first_error(validator, data)
+        if error is not None:
+            return (False, [f"{error.json_path}: {error.message}"])
+        return (True, [])
 
     def validate_task_request(self, data: dict) -> tuple[bool, list[str]]:
         """Validate a TaskRequest against its schema."""
@@ -112,16 +129,14 @@ class RegistryValidator:
         if not registry_path.exists():
             return (False, ["kernels.json not found"])
 
-        with open(registry_path) as f:
-            registry = json.load(f)
+        registry = load_registry()  # Shared, cached parse
 
         kernels = registry.get("kernels", [])
         errors = []
 
         for i, kernel in enumerate(kernels):
-            try:
-                validate(instance=kernel, schema=self.KERNEL_ENTRY_SCHEMA)
-            except ValidationError as e:
+            e = _first_error(_KERNEL_ENTRY_VALIDATOR, kernel)
+            if e is not None:
                 errors.append(f"kernels[{i}] ({kernel.get('kernel_id', 'unknown')}): {e.message}")
 
         return (len(errors) == 0, errors)
@@ -132,16 +147,14 @@ class RegistryValidator:
         if not registry_path.exists():
             return (False, ["quantities.json not found"])
 
-        with open(registry_path) as f:
-            registry = json.load(f)
+        registry = load_quantities()  # Shared, cached parse
 
         quantities = registry.get("quantities", [])
         errors = []
 
         for i, qty in enumerate(quantities):
-            try:
-                validate(instance=qty, schema=self.QUANTITY_ENTRY_SCHEMA)
-            except ValidationError as e:
+            e = _first_error(_QUANTITY_ENTRY_VALIDATOR, qty)
+            if e is not None:
                 errors.append(f"quantities[{i}] ({qty.get('quantity_id', 'unknown')}): {e.message}")
 
         return (len(errors) == 0, errors)
@@ -192,14 +205,12 @@ class PolicyValidator:
 
     def validate_policy(self, policy_name: str) -> tuple[bool, list[str]]:
         """Validate a specific policy file."""
-        import yaml
-
         policy_path = POLICIES_DIR / f"{policy_name}.yaml"
         if not policy_path.exists():
             return (False, [f"Policy not found: {policy_name}"])
 
         with open(policy_path) as f:
-            policy = yaml.safe_load(f)
+            policy = yaml.load(f, Loader=_YAML_LOADER)
 
         if policy is None:
             return (False, [f"Policy {policy_name} is empty or invalid YAML"])
@@ -212,15 +223,14 @@ class PolicyValidator:
 
         # Choose schema based on policy type
         if policy_name == "unit_disambiguation":
-            schema = self.UNIT_DISAMBIGUATION_SCHEMA
+            validator = _UNIT_DISAMBIGUATION_VALIDATOR
         else:
-            schema = self.POLICY_BASE_SCHEMA
+            validator = _POLICY_BASE_VALIDATOR
 
-        try:
-            validate(instance=policy, schema=schema)
-            return (True, [])
-        except ValidationError as e:
+        e = _first_error(validator, policy)
+        if e is not None:
             return (False, [f"{policy_name}: {e.message}"])
+        return (True, [])
 
     def validate_all_policies(self) -> tuple[bool, list[str]]:
         """Validate all policy files."""
@@ -234,6 +244,13 @@ class PolicyValidator:
         return (len(all_errors) == 0, all_errors)
 
 
+# Inline schemas compiled once at import
+_KERNEL_ENTRY_VALIDATOR = _compile_schema(RegistryValidator.KERNEL_ENTRY_SCHEMA)
+_QUANTITY_ENTRY_VALIDATOR = _compile_schema(RegistryValidator.QUANTITY_ENTRY_SCHEMA)
+_POLICY_BASE_VALIDATOR = _compile_schema(PolicyValidator.POLICY_BASE_SCHEMA)
+_UNIT_DISAMBIGUATION_VALIDATOR = _compile_schema(PolicyValidator.UNIT_DISAMBIGUATION_SCHEMA)
+
+
 # Convenience functions
 
 
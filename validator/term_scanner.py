@@ -0,0 +1,44 @@
+"""
+TermScanner: Single-pass multi-keyword substring search.
+
+Shared by the validator gates and the router classifier, which both need to
+know which of a fixed list of terms occur in a request.
+"""
+
+import functools
+import re
+
+
+class TermScanner:
+    """
+    Find which of a set of terms occur in a text, in one pass.
+
+    Stands in for an Aho-Corasick automaton: a lookahead alternation (longest
+    term first) reports a match at every position, and terms that are
+    prefixes of a longer match are added from a precomputed containment map.
+    Matching is case-sensitive; callers lowercase text and terms as needed.
+    """
+
+    def __init__(self, terms: tuple[str, ...]):
+        ordered = sorted(set(terms), key=len, reverse=True)
+        self._pattern = (
+            re.compile("(?=(%s))" % "|".join(map(re.escape, ordered))) if ordered else None
+        )
+        self._contained = {t: {u for u in ordered if u in t} for t in ordered}
+        # Text shorter than the shortest term cannot contain any of them
+        self._min_len = len(ordered[-1]) if ordered else 0
+
+    def find(self, text: str) -> set[str]:
+        """Return every term that occurs as a substring of text."""
+        if self._pattern is None or len(text) < self._min_len:
+            return set()
+        hits: set[str] = set()
+        for match in set(self._pattern.findall(text)):
+            hits |= self._contained[match]
+        return hits
+
+
+@functools.lru_cache(maxsize=32)
+def term_scanner(terms: tuple[str, ...]) -> TermScanner:
+    """Scanner for a term list, built once per distinct list."""
+    return TermScanner(terms)